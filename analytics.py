@@ -0,0 +1,193 @@
+# pip install numpy
+# coded by zainuddin@codemaster.my
+# for educational purposes only
+
+import numpy as np
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+# ======================
+# Tail-Latency & Fairness Analytics
+# ======================
+# Purata TAT/WT/RT menyembunyikan starvation. Modul ini kira taburan
+# persentil, slowdown, Jain's fairness index, laporan starvation dan
+# utilization ikut masa — semuanya vectorized atas lajur NumPy, jadi
+# 10^7 proses selesai dalam beberapa saat.
+#
+# Lajur (dict nama → np.ndarray, panjang sama):
+#   arrival, burst, priority, start, completion  (+ category jika ada)
+
+DEFAULT_PERCENTILES = (50, 90, 99, 99.9)
+
+Columns = Dict[str, np.ndarray]
+
+
+def from_processes(procs: Iterable) -> Columns:
+    """
+    Columns from finished Process objects (mana-mana skrip).
+    Lajur priority = priority asal (p.base_priority jika ada), bukan nilai selepas aging.
+    """
+    procs = list(procs)
+    cols = {
+        "arrival": np.array([p.arrival for p in procs], dtype=np.int64),
+        "burst": np.array([p.burst for p in procs], dtype=np.int64),
+        "priority": np.array([getattr(p, "base_priority", getattr(p, "priority", 0)) for p in procs],
+                             dtype=np.int64),
+        "start": np.array([p.start_time for p in procs], dtype=np.int64),
+        "completion": np.array([p.completion_time for p in procs], dtype=np.int64),
+    }
+    categories = [getattr(p, "category", None) for p in procs]
+    if any(c is not None for c in categories):
+        cols["category"] = np.array([str(c) for c in categories])
+    return cols
+
+
+def from_run(workload: Sequence[Tuple[str, int, int, int]], metrics: Sequence[tuple]) -> Columns:
+    """Columns from engine.simulate() output: workload tuples + (name, start, completion, response)."""
+    return {
+        "arrival": np.array([w[1] for w in workload], dtype=np.int64),
+        "burst": np.array([w[2] for w in workload], dtype=np.int64),
+        "priority": np.array([w[3] for w in workload], dtype=np.int64),
+        "start": np.array([m[1] for m in metrics], dtype=np.int64),
+        "completion": np.array([m[2] for m in metrics], dtype=np.int64),
+    }
+
+
+def derive(cols: Columns) -> Columns:
+    """Tambah lajur tat, wt, rt dan slowdown (TAT / burst)."""
+    tat = cols["completion"] - cols["arrival"]
+    out = dict(cols)
+    out["tat"] = tat
+    out["wt"] = tat - cols["burst"]
+    out["rt"] = cols["start"] - cols["arrival"]
+    out["slowdown"] = tat / np.maximum(cols["burst"], 1)
+    return out
+
+
+# ======================
+# Distributions
+# ======================
+def percentiles(values: np.ndarray, groups: Optional[np.ndarray] = None,
+                qs: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[object, np.ndarray]:
+    """
+    Persentil `qs` bagi `values`, keseluruhan (kunci "all") atau ikut kumpulan
+    (cth. groups=cols["priority"]). Satu argsort, kemudian potong ikut kumpulan.
+    """
+    values = np.asarray(values)
+    if groups is None:
+        return {"all": np.percentile(values, qs)}
+    order = np.argsort(groups, kind="stable")
+    keys, first = np.unique(groups[order], return_index=True)
+    parts = np.split(values[order], first[1:])
+    return {k.item() if hasattr(k, "item") else k: np.percentile(part, qs)
+            for k, part in zip(keys, parts)}
+
+
+def jain_index(x: np.ndarray) -> float:
+    """Jain's fairness index: (Σx)² / (n·Σx²); 1.0 = adil sepenuhnya, 1/n = paling tidak adil."""
+    x = np.asarray(x, dtype=np.float64)
+    if x.size == 0:
+        return 1.0
+    denom = x.size * np.dot(x, x)
+    return float(x.sum() ** 2 / denom) if denom else 1.0
+
+
+def starvation(cols: Columns, top: int = 10, threshold: Optional[float] = None) -> Dict[str, object]:
+    """
+    Laporan starvation: `top` proses dengan WT paling lama (argpartition, O(n)),
+    bilangan proses dengan WT > threshold, dan WT maksimum ikut priority.
+    """
+    cols = cols if "wt" in cols else derive(cols)
+    wt = cols["wt"]
+    top = min(top, wt.size)
+    idx = np.argpartition(wt, wt.size - top)[wt.size - top:] if top else np.array([], dtype=np.int64)
+    idx = idx[np.argsort(wt[idx])[::-1]]
+
+    prio = cols["priority"]
+    order = np.argsort(prio, kind="stable")
+    keys, first = np.unique(prio[order], return_index=True)
+    max_by_prio = np.maximum.reduceat(wt[order], first) if wt.size else np.array([])
+
+    return {
+        "worst": idx,
+        "worst_wt": wt[idx],
+        "over_threshold": int((wt > threshold).sum()) if threshold is not None else None,
+        "max_wt_by_priority": dict(zip(keys.tolist(), max_by_prio.tolist())),
+    }
+
+
+def utilization(timeline: Sequence[Tuple[int, int, str]], bin_size: int = 10,
+                horizon: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Time-series utilization daripada timeline (start, end, name).
+    Slice IDLE dan CTX tidak dikira sebagai kerja berguna.
+    Pulangkan (bin_start, busy_fraction).
+    """
+    seg = [(s, e) for (s, e, name) in timeline if name not in ("IDLE", "CTX")]
+    starts = np.array([s for s, _ in seg], dtype=np.float64)
+    ends = np.array([e for _, e in seg], dtype=np.float64)
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], ends[order]
+    if horizon is None:
+        horizon = max((e for (_, e, _) in timeline), default=0)
+
+    edges = np.arange(0, horizon + bin_size, bin_size, dtype=np.float64)
+    # busy(t) = jumlah kerja sebelum segmen k + bahagian segmen k sebelum t
+    cum = np.concatenate(([0.0], np.cumsum(ends - starts)))
+    k = np.searchsorted(starts, edges, side="right") - 1
+    inside = np.clip(edges - starts[np.maximum(k, 0)], 0, (ends - starts)[np.maximum(k, 0)]) \
+        if starts.size else np.zeros_like(edges)
+    busy = np.where(k >= 0, cum[np.maximum(k, 0)] + inside, 0.0)
+    return edges[:-1], np.diff(busy) / bin_size
+
+
+# ======================
+# Report
+# ======================
+def report(cols: Columns, qs: Sequence[float] = DEFAULT_PERCENTILES, top: int = 5):
+    cols = derive(cols)
+    header = " | ".join(f"p{q:g}" for q in qs)
+
+    print("=== Tail Latency ===")
+    for metric in ("tat", "wt", "rt", "slowdown"):
+        row = " | ".join(f"{v:.2f}" for v in percentiles(cols[metric], qs=qs)["all"])
+        print(f"{metric.upper():>8}: {header} = {row}")
+
+    for label, key in (("Priority", "priority"), ("Category", "category")):
+        if key not in cols:
+            continue
+        print(f"\n=== WT by {label} ({header}) ===")
+        for group, vals in percentiles(cols["wt"], cols[key], qs).items():
+            print(f"{label} {group}: " + " | ".join(f"{v:.2f}" for v in vals))
+
+    print("\n=== Fairness ===")
+    print(f"Jain's index (1/slowdown): {jain_index(1.0 / cols['slowdown']):.4f}")
+
+    print("\n=== Starvation ===")
+    starve = starvation(cols, top=top)
+    for i, wt in zip(starve["worst"].tolist(), starve["worst_wt"].tolist()):
+        print(f"#{i} | A={cols['arrival'][i]}, B={cols['burst'][i]}, P={cols['priority'][i]}, WT={wt}")
+    for prio, wt in starve["max_wt_by_priority"].items():
+        print(f"Max WT for priority {prio}: {wt}")
+
+
+# ======================
+# Run Analysis (demo)
+# ======================
+if __name__ == "__main__":
+    import random
+    import engine
+
+    # Workload sibuk: banyak proses priority tinggi, beberapa priority rendah yang boleh 'kebulur'
+    rng = random.Random(7)
+    workload, t = [], 0
+    for k in range(300):
+        t += rng.randint(0, 3)
+        workload.append((f"P{k + 1}", t, rng.randint(1, 6), rng.choice([1, 1, 1, 2, 3])))
+
+    for aging in (False, True):
+        timeline, metrics = engine.simulate("priority-p", workload, aging=aging,
+                                            aging_interval=5, aging_step=1)
+        print(f"\n##### priority-p, AGING={aging} #####")
+        report(from_run(workload, metrics))
+        _, util = utilization(timeline, bin_size=50)
+        print("\nUtilization per 50 units: " + " ".join(f"{u:.2f}" for u in util))
@@ -0,0 +1,213 @@
+# pip install simpy
+# coded by zainuddin@codemaster.my
+# for educational purposes only
+
+import heapq
+import simpy
+from eventlog import NullLog
+from typing import List, Tuple, Optional
+
+# ======================
+# CFS (Completely Fair Scheduler) Setup
+# ======================
+
+# Jadual berat ikut nilai nice (-20 .. 19), sama seperti kernel Linux.
+# nice 0 = 1024; setiap langkah nice ~ 1.25x beza masa CPU.
+NICE_0_LOAD = 1024
+PRIO_TO_WEIGHT = [
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+]
+
+
+class Process:
+    def __init__(self, name: str, arrival: int, burst: int, priority: int = 0):
+        self.name = name
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority  # nilai nice: lower = higher priority
+        self.remaining = burst
+        self.vruntime = 0.0
+        self.start_time: Optional[int] = None
+        self.completion_time: Optional[int] = None
+        self.response_time: Optional[int] = None
+
+    @property
+    def weight(self) -> int:
+        nice = min(max(self.priority, -20), 19)
+        return PRIO_TO_WEIGHT[nice + 20]
+
+    def __repr__(self):
+        return f"{self.name}(A={self.arrival},B={self.burst},P={self.priority},V={self.vruntime:.2f})"
+
+
+# ======================
+# Parameter (boleh ubah)
+# ======================
+env = simpy.Environment()
+
+# Senarai proses: (Nama, Arrival, Burst, Nice)
+# *nombor kecil = lebih banyak masa CPU*
+procs: List[Process] = [
+    Process("P1", 0, 8, 0),
+    Process("P2", 1, 4, -5),
+    Process("P3", 2, 6, 5),
+    Process("P4", 3, 3, 0),
+]
+
+TARGET_LATENCY = 6      # tempoh di mana setiap proses runnable dapat giliran
+MIN_GRANULARITY = 1     # timeslice paling kecil bagi satu proses
+
+# Context switch overhead (unit masa). Tetapkan 0 jika tak perlu.
+CTX = 0
+
+
+# ======================
+# CFS Function
+# ======================
+def cfs(env: simpy.Environment, processes: List[Process],
+        target_latency: int = 6, min_granularity: int = 1, ctx_overhead: int = 0,
+        log: Optional[NullLog] = None):
+    """
+    CFS-style fair scheduling, event-driven (satu timeout bagi setiap slice).
+    Ready queue disusun ikut vruntime (heap: vruntime, seq); pilih vruntime paling kecil.
+    Timeslice = period * weight / total_weight, minimum 'min_granularity',
+    di mana period = target_latency, atau nr_running * min_granularity bila terlalu ramai.
+    Proses baru bermula pada min_vruntime supaya tidak memonopoli CPU.
+    Slice dipendekkan bila ada proses tiba, jadi ia bersaing serta-merta.
+    Setiap slice O(log n), jadi sesuai untuk 10^5 proses runnable serentak.
+    log: sink eventlog (value "dispatch" = remaining selepas slice).
+    """
+    log = log or NullLog()
+    timeline: List[Tuple[int, int, str]] = []   # (start, end, name/CTX/IDLE)
+    processes = sorted(processes, key=lambda p: (p.arrival, p.name))
+    ready: List[Tuple[float, int, Process]] = []
+    i = 0
+    n = len(processes)
+    seq = 0                 # tie-break stabil untuk vruntime yang sama
+    total_weight = 0        # jumlah berat semua proses runnable (ready + current)
+    min_vruntime = 0.0
+    sched_nr_latency = max(1, target_latency // min_granularity)
+    last: Optional[Process] = None
+
+    while i < n or ready:
+        # Masukkan proses yang sudah tiba
+        while i < n and processes[i].arrival <= env.now:
+            p = processes[i]
+            p.vruntime = min_vruntime
+            heapq.heappush(ready, (p.vruntime, seq, p))
+            seq += 1
+            total_weight += p.weight
+            i += 1
+
+        if not ready:
+            # Tiada proses — CPU idle
+            next_arrival = processes[i].arrival
+            timeline.append((env.now, next_arrival, "IDLE"))
+            log.emit("idle", env.now, next_arrival, "IDLE")
+            yield env.timeout(next_arrival - env.now)
+            continue
+
+        _, _, current = heapq.heappop(ready)
+
+        # Context switch bila bertukar proses
+        if ctx_overhead > 0 and last is not None and last is not current:
+            timeline.append((env.now, env.now + ctx_overhead, "CTX"))
+            log.emit("ctx", env.now, env.now + ctx_overhead, "CTX")
+            yield env.timeout(ctx_overhead)
+        last = current
+
+        if current.start_time is None:
+            current.start_time = env.now
+            current.response_time = current.start_time - current.arrival
+
+        # Kira timeslice dinamik
+        nr_running = len(ready) + 1
+        if nr_running > sched_nr_latency:
+            period = nr_running * min_granularity
+        else:
+            period = target_latency
+        timeslice = max(min_granularity, period * current.weight // total_weight)
+        exec_time = min(timeslice, current.remaining)
+
+        # Proses baru tiba di tengah slice → berhenti di situ supaya ia boleh bersaing (wakeup)
+        if i < n and env.now < processes[i].arrival < env.now + exec_time:
+            exec_time = processes[i].arrival - env.now
+
+        start = env.now
+        timeline.append((start, start + exec_time, current.name))
+        log.emit("dispatch", start, start + exec_time, current.name, current.remaining - exec_time)
+        yield env.timeout(exec_time)
+
+        current.remaining -= exec_time
+        current.vruntime += exec_time * NICE_0_LOAD / current.weight
+
+        if current.remaining > 0:
+            log.emit("preempt", env.now, env.now, current.name, current.remaining)
+            heapq.heappush(ready, (current.vruntime, seq, current))
+            seq += 1
+        else:
+            current.completion_time = env.now
+            log.emit("complete", env.now, env.now, current.name)
+            total_weight -= current.weight
+
+        # min_vruntime hanya bergerak ke hadapan
+        if ready:
+            min_vruntime = max(min_vruntime, ready[0][0])
+        else:
+            min_vruntime = max(min_vruntime, current.vruntime)
+
+    return timeline
+
+
+def gantt_chart(timeline: List[Tuple[int, int, str]]):
+    print("\n=== Gantt Chart ===")
+    for (st, en, name) in timeline:
+        print(f"{name}: {st} → {en}")
+
+
+# ======================
+# Run Simulation
+# ======================
+
+if __name__ == "__main__":
+    # Paparkan semua input proses sebelum sebarang output simulasi
+    print("=== Input Processes ===")
+    for p in procs:
+        print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}, Nice={p.priority}, Weight={p.weight}")
+
+    print()
+    timeline = env.process(
+        cfs(env, procs, target_latency=TARGET_LATENCY,
+            min_granularity=MIN_GRANULARITY, ctx_overhead=CTX)
+    )
+    env.run()
+
+    # ======================
+    # Compute Metrics
+    # ======================
+    print("\n=== Metrics ===")
+    tot_tat = tot_wt = tot_rt = 0.0
+    for p in procs:
+        tat = p.completion_time - p.arrival
+        wt = tat - p.burst
+        rt = p.response_time
+        tot_tat += tat
+        tot_wt += wt
+        tot_rt += rt
+        print(f"{p.name} | A={p.arrival}, B={p.burst}, Nice={p.priority}, "
+              f"Start={p.start_time}, Complete={p.completion_time}, "
+              f"TAT={tat}, WT={wt}, RT={rt}")
+
+    n = len(procs)
+    print(f"\nAverage Turnaround Time: {tot_tat/n:.2f}")
+    print(f"Average Waiting Time:    {tot_wt/n:.2f}")
+    print(f"Average Response Time:   {tot_rt/n:.2f}")
+
+    gantt_chart(timeline.value)
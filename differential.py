@@ -0,0 +1,238 @@
+# pip install simpy
+# coded by zainuddin@codemaster.my
+# for educational purposes only
+
+import argparse
+import os
+import random
+import sys
+from collections import namedtuple
+from multiprocessing import Pool
+from typing import Iterator, List, Optional
+
+import engine
+
+# ======================
+# Differential Test Harness
+# ======================
+# Jana workload rawak, jalankan skrip asal (rujukan, SimPy) dan enjin
+# alternatif, kemudian banding timeline + metrics. Kes gagal dikecilkan
+# (shrink) sehingga contoh balas paling minimum.
+
+Case = namedtuple("Case", "algorithm workload params")
+
+
+def run_step(algorithm, workload, params):
+    return engine.simulate(algorithm, workload, engine="step", **params)
+
+
+ONLINE_POLICIES = {"fcfs": "fcfs", "sjf": "sjf", "rr": "rr", "priority-np": "priority"}
+
+
+def run_online(algorithm, workload, params):
+    import online
+    procs = [online.Process(*job) for job in workload]
+    kwargs = {k: v for k, v in params.items() if k in engine.ALGORITHMS[algorithm].params and k != "log"}
+    timeline = online.simulate(procs, ONLINE_POLICIES[algorithm], **kwargs)
+    return timeline, [(p.name, p.start_time, p.completion_time, p.response_time) for p in procs]
+
+
+# Enjin calon yang boleh dibandingkan dengan rujukan:
+# nama → (fungsi, algoritma yang disokong atau None untuk semua)
+CANDIDATES = {
+    "step": (run_step, None),
+    "online": (run_online, tuple(ONLINE_POLICIES)),
+}
+
+
+def run_reference(algorithm, workload, params):
+    return engine.simulate(algorithm, workload, engine="simpy", **params)
+
+
+# ======================
+# Random Workloads
+# ======================
+def random_case(rng: random.Random, algorithms: List[str]) -> Case:
+    """
+    Workload kecil tetapi 'jahat': arrival/burst/priority yang sama (ties),
+    jurang idle, CTX > 0 dan aging dihidupkan secara rawak.
+    """
+    algorithm = rng.choice(algorithms)
+    time = rng.choice([0, 0, rng.randint(1, 5)])   # kadang-kadang idle di awal
+    workload = []
+    for k in range(rng.randint(1, 8)):
+        r = rng.random()
+        if r < 0.3:
+            gap = 0                         # tiba serentak
+        elif r < 0.85:
+            gap = rng.randint(1, 3)
+        else:
+            gap = rng.randint(4, 12)        # jurang idle
+        time += gap
+        workload.append((f"P{k + 1}", time, rng.randint(1, 6), rng.randint(1, 3)))
+    rng.shuffle(workload)
+
+    params = {
+        "ctx_overhead": rng.choice([0, 0, 1, 2]),
+        "quantum": rng.randint(1, 4),
+        "aging": rng.random() < 0.5,
+        "aging_interval": rng.randint(1, 5),
+        "aging_step": rng.randint(1, 2),
+        "target_latency": rng.randint(2, 8),
+        "min_granularity": rng.randint(1, 2),
+    }
+    return Case(algorithm, workload, params)
+
+
+# ======================
+# Compare
+# ======================
+def _outcome(runner, case: Case):
+    try:
+        return runner(case.algorithm, case.workload, case.params)
+    except Exception as exc:   # ralat juga sebahagian daripada tingkah laku
+        return ("error", f"{type(exc).__name__}: {exc}")
+
+
+def check(case: Case, candidate: str) -> Optional[str]:
+    """Return a description of the first difference, or None if both engines agree."""
+    expected = _outcome(run_reference, case)
+    actual = _outcome(CANDIDATES[candidate][0], case)
+    if expected == actual:
+        return None
+    if expected[0] == "error" or actual[0] == "error":
+        return f"reference={expected!r}\ncandidate={actual!r}"
+
+    (exp_timeline, exp_metrics), (act_timeline, act_metrics) = expected, actual
+    for k in range(max(len(exp_timeline), len(act_timeline))):
+        exp = exp_timeline[k] if k < len(exp_timeline) else None
+        act = act_timeline[k] if k < len(act_timeline) else None
+        if exp != act:
+            return f"timeline[{k}]: reference={exp} candidate={act}"
+    for exp, act in zip(exp_metrics, act_metrics):
+        if exp != act:
+            return ("metrics (name, start, completion, response): "
+                    f"reference={exp} candidate={act}")
+    return None
+
+
+# ======================
+# Shrink
+# ======================
+def _smaller(case: Case) -> Iterator[Case]:
+    workload = case.workload
+    # 1) buang satu proses
+    for k in range(len(workload)):
+        if len(workload) > 1:
+            yield case._replace(workload=workload[:k] + workload[k + 1:])
+    # 2) permudahkan parameter
+    for key, simplest in (("ctx_overhead", 0), ("aging", False), ("quantum", 1),
+                          ("aging_interval", 1), ("aging_step", 1),
+                          ("target_latency", 1), ("min_granularity", 1)):
+        value = case.params[key]
+        if value != simplest:
+            yield case._replace(params=dict(case.params, **{key: simplest}))
+            if not isinstance(value, bool) and value - 1 > simplest:
+                yield case._replace(params=dict(case.params, **{key: value - 1}))
+    # 3) kecilkan nilai arrival / burst / priority
+    for k, (name, arrival, burst, priority) in enumerate(workload):
+        for job in ((name, 0, burst, priority), (name, arrival - 1, burst, priority),
+                    (name, arrival, 1, priority), (name, arrival, burst - 1, priority),
+                    (name, arrival, burst, 1)):
+            if job != workload[k] and job[1] >= 0 and job[2] >= 1:
+                yield case._replace(workload=workload[:k] + [job] + workload[k + 1:])
+
+
+def shrink(case: Case, candidate: str) -> Case:
+    """Greedy shrink: ambil mana-mana kes lebih kecil yang masih gagal, ulang sehingga tiada."""
+    progress = True
+    while progress:
+        progress = False
+        for smaller in _smaller(case):
+            if check(smaller, candidate) is not None:
+                case = smaller
+                progress = True
+                break
+    return case
+
+
+# ======================
+# Fixed Regression Cases (realtime.py)
+# ======================
+# realtime.py tiada rujukan kedua untuk dibandingkan, jadi kes yang pernah
+# salah disemak terus: (scheduler, tasks (nama, C, T), jangkaan {task: misses}).
+REALTIME_CASES = [
+    # Job terakhir belum siap pada horizon = deadline-nya (lateness 0) tetap miss
+    ("edf", [("A", 6, 5)], {"A": 1}),
+    ("edf", [("A", 3, 5), ("B", 3, 7)], {"A": 1, "B": 0}),
+]
+
+
+def check_realtime() -> List[str]:
+    import simpy
+    import realtime
+    failures = []
+    for scheduler, spec, expected in REALTIME_CASES:
+        tasks = [realtime.Task(*t) for t in spec]
+        env = simpy.Environment()
+        env.process(getattr(realtime, scheduler)(env, tasks))
+        env.run()
+        got = {t.name: t.misses for t in tasks}
+        if got != expected:
+            failures.append(f"{scheduler} {spec}: misses {got}, expected {expected}")
+    return failures
+
+
+# ======================
+# Runner
+# ======================
+def _run_seed(task):
+    seed, algorithms, candidate = task
+    case = random_case(random.Random(seed), algorithms)
+    if check(case, candidate) is None:
+        return seed, None, None
+    case = shrink(case, candidate)
+    return seed, case, check(case, candidate)
+
+
+def run(cases: int, seed: int = 0, jobs: int = 1, candidate: str = "step",
+        algorithms: Optional[List[str]] = None) -> List[tuple]:
+    """Run `cases` random cases (seed, seed+1, ...) and return shrunk failures."""
+    algorithms = algorithms or list(CANDIDATES[candidate][1] or engine.ALGORITHMS)
+    tasks = [(s, algorithms, candidate) for s in range(seed, seed + cases)]
+    if jobs > 1:
+        with Pool(jobs) as pool:
+            results = list(pool.imap_unordered(_run_seed, tasks, chunksize=max(1, cases // (jobs * 8))))
+    else:
+        results = [_run_seed(t) for t in tasks]
+    return sorted(r for r in results if r[1] is not None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Differential check of scheduler engines against the reference scripts.")
+    parser.add_argument("--cases", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--candidate", choices=sorted(CANDIDATES), default="step")
+    parser.add_argument("--algorithm", action="append", choices=sorted(engine.ALGORITHMS),
+                        help="limit to these algorithms (boleh ulang)")
+    args = parser.parse_args(argv)
+
+    failures = run(args.cases, args.seed, args.jobs, args.candidate, args.algorithm)
+    regressions = check_realtime()
+
+    print("=== Differential Check ===")
+    print(f"Candidate: {args.candidate} | Cases: {args.cases} | Failures: {len(failures)}")
+    for seed, case, diff in failures:
+        print(f"\n--- seed {seed} ({case.algorithm}) ---")
+        print(f"Workload: {case.workload}")
+        print(f"Params:   {case.params}")
+        print(diff)
+    print(f"\nRealtime regression cases: {len(REALTIME_CASES) - len(regressions)}/{len(REALTIME_CASES)} pass")
+    for line in regressions:
+        print(f"  {line}")
+    return 1 if failures or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
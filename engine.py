@@ -0,0 +1,132 @@
+# pip install simpy
+# coded by zainuddin@codemaster.my
+# for educational purposes only
+
+import importlib.util
+import os
+from collections import namedtuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# ======================
+# Registry of Scheduler Scripts
+# ======================
+# Setiap algoritma kekal sebagai skrip standalone; fail ini hanya tahu
+# cara memuatkan skrip tersebut dan memanggil fungsi scheduler-nya.
+
+Algorithm = namedtuple("Algorithm", "script function priority params")
+
+ALGORITHMS: Dict[str, Algorithm] = {
+    "fcfs": Algorithm("fcfs.py", "fcfs", False, ("log",)),
+    "sjf": Algorithm("sjf.py", "sjf_non_preemptive", False, ("log", "predictor")),
+    "srtf": Algorithm("srtf.py", "srtf", False, ("ctx_overhead", "predictor", "log")),
+    "rr": Algorithm("round-robin.py", "round_robin", False, ("quantum", "log")),
+    "priority-np": Algorithm("priority-non-preemtive.py", "priority_non_preemptive", True,
+                             ("ctx_overhead", "log")),
+    "priority-p": Algorithm("priority-preemtive.py", "priority_preemptive", True,
+                            ("ctx_overhead", "aging", "aging_interval", "aging_step", "log")),
+    "cfs": Algorithm("cfs.py", "cfs", True,
+                     ("target_latency", "min_granularity", "ctx_overhead", "log")),
+}
+
+# Workload: (name, arrival, burst, priority)
+Job = Tuple[str, int, int, int]
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+_modules: Dict[str, object] = {}
+
+
+def load(name: str):
+    """Import the script behind algorithm `name` (nama fail ada '-', jadi guna importlib)."""
+    algo = ALGORITHMS[name]
+    if algo.script not in _modules:
+        path = os.path.join(HERE, algo.script)
+        mod_name = os.path.splitext(algo.script)[0].replace("-", "_")
+        spec = importlib.util.spec_from_file_location(mod_name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[algo.script] = module
+    return _modules[algo.script]
+
+
+def make_processes(name: str, workload: Sequence[Job]) -> list:
+    """Build the script's own Process objects from plain workload tuples."""
+    module = load(name)
+    if ALGORITHMS[name].priority:
+        return [module.Process(nm, a, b, p) for (nm, a, b, p) in workload]
+    return [module.Process(nm, a, b) for (nm, a, b, _) in workload]
+
+
+# ======================
+# SimPy-free Engine
+# ======================
+class Environment:
+    """
+    Pengganti minimum simpy.Environment untuk satu proses scheduler.
+    Scheduler hanya guna env.now dan env.timeout(delay), jadi cukup
+    majukan jam terus tanpa event queue.
+    """
+
+    def __init__(self):
+        self.now = 0
+        self.value = None
+        self._generator = None
+
+    def timeout(self, delay):
+        if delay < 0:
+            raise ValueError(f"Negative delay {delay}")   # sama seperti SimPy
+        return delay
+
+    def process(self, generator):
+        self._generator = generator
+        return self
+
+    def run(self):
+        generator = self._generator
+        try:
+            delay = next(generator)
+            while True:
+                self.now += delay
+                delay = generator.send(None)
+        except StopIteration as stop:
+            self.value = stop.value
+
+
+ENGINES = ("simpy", "step")
+
+
+def simulate(name: str, workload: Sequence[Job], engine: str = "simpy", **params):
+    """
+    Run algorithm `name` on `workload` and return (timeline, metrics).
+    metrics: senarai (name, start_time, completion_time, response_time) ikut susunan input.
+    Parameter yang tidak digunakan oleh algoritma tersebut diabaikan
+    (cth. quantum untuk fcfs). Semua algoritma terima log=..., lihat eventlog.py.
+    """
+    algo = ALGORITHMS[name]
+    function = getattr(load(name), algo.function)
+    kwargs = {k: v for k, v in params.items() if k in algo.params and v is not None}
+    procs = make_processes(name, workload)
+
+    if engine == "simpy":
+        import simpy
+        env = simpy.Environment()
+    elif engine == "step":
+        env = Environment()
+    else:
+        raise ValueError(f"unknown engine {engine!r} (choose from {', '.join(ENGINES)})")
+
+    run = env.process(function(env, procs, **kwargs))
+    env.run()
+    metrics = [(p.name, p.start_time, p.completion_time, p.response_time) for p in procs]
+    return run.value, metrics
+
+
+def averages(workload: Sequence[Job], metrics: List[Tuple[str, int, int, Optional[int]]]):
+    """Average TAT, WT and RT, dikira sama seperti bahagian Metrics dalam setiap skrip."""
+    tot_tat = tot_wt = tot_rt = 0.0
+    for (_, arrival, burst, _), (_, _, completion, response) in zip(workload, metrics):
+        tat = completion - arrival
+        tot_tat += tat
+        tot_wt += tat - burst
+        tot_rt += response
+    n = len(workload) or 1
+    return tot_tat / n, tot_wt / n, tot_rt / n
@@ -0,0 +1,187 @@
+# coded by zainuddin@codemaster.my
+# for educational purposes only
+
+import json
+import queue
+import struct
+import threading
+from typing import Iterator, List, Optional, Tuple
+
+# ======================
+# Structured Event Log
+# ======================
+# Scheduler tidak lagi print() dalam loop; ia panggil log.emit(...) dan
+# sink yang dipilih tentukan sama ada event dibuang, disimpan dalam memori,
+# dipaparkan ke terminal atau ditulis ke fail oleh thread latar belakang.
+#
+# Event: (kind, start, end, name, value)
+#   kind  : "dispatch" | "preempt" | "complete" | "idle" | "ctx"
+#   value : maklumat tambahan (cth. remaining untuk RR, priority untuk Priority), atau None
+
+KINDS = ("dispatch", "preempt", "complete", "idle", "ctx")
+
+Event = Tuple[str, int, int, str, Optional[int]]
+
+
+class NullLog:
+    """Discard every event (default bila scheduler dipanggil tanpa log)."""
+
+    def emit(self, kind, start, end, name, value=None):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MemoryLog(NullLog):
+    """Buffer events in a list, e.g. for tests or post-run analysis."""
+
+    def __init__(self):
+        self.events: List[Event] = []
+
+    def emit(self, kind, start, end, name, value=None):
+        self.events.append((kind, start, end, name, value))
+
+
+class ConsoleLog(NullLog):
+    """
+    Print dispatch and idle events in the scripts' original format, e.g.
+    'P1 running from 0 to 3 (remaining 7)' bila label="remaining".
+    """
+
+    def __init__(self, label: Optional[str] = None):
+        self.label = label
+
+    def emit(self, kind, start, end, name, value=None):
+        if kind == "idle":
+            print(f"CPU idle from {start} to {end}")
+        elif kind == "dispatch":
+            suffix = f" ({self.label} {value})" if self.label else ""
+            print(f"{name} running from {start} to {end}{suffix}")
+
+
+# ======================
+# Background File Writers
+# ======================
+class _BackgroundLog(NullLog):
+    """
+    Kumpul event dalam batch; batch penuh diserahkan kepada thread penulis
+    melalui queue, jadi loop simulasi hanya buat list.append().
+    Panggil close() (atau guna 'with') untuk flush baki batch; ralat dalam
+    thread penulis (cth. disk penuh) dibangkitkan semula oleh close().
+    """
+
+    mode = "w"
+
+    def __init__(self, path: str, batch_size: int = 8192):
+        self.batch_size = batch_size
+        self._buffer: List[Event] = []
+        self._queue: "queue.Queue[Optional[List[Event]]]" = queue.Queue()
+        self._file = open(path, self.mode)
+        self._error: Optional[BaseException] = None
+        self._write_header()
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def emit(self, kind, start, end, name, value=None):
+        self._buffer.append((kind, start, end, name, value))
+        if len(self._buffer) >= self.batch_size:
+            self._queue.put(self._buffer)
+            self._buffer = []
+
+    def _drain(self):
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                break
+            if self._error is not None:
+                continue   # fail sudah rosak; buang baki batch supaya close() tidak tergantung
+            try:
+                self._file.write(self._encode(batch))
+            except Exception as exc:
+                self._error = exc
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self._buffer:
+            self._queue.put(self._buffer)
+            self._buffer = []
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+        if self._error is not None:
+            raise IOError(f"{self._file.name}: event log is incomplete") from self._error
+
+    def _write_header(self):
+        pass
+
+    def _encode(self, batch: List[Event]):
+        raise NotImplementedError
+
+
+class JsonlLog(_BackgroundLog):
+    """One JSON object per line: {"kind", "start", "end", "name", "value"}."""
+
+    def _encode(self, batch):
+        return "".join(
+            json.dumps({"kind": k, "start": s, "end": e, "name": n, "value": v}) + "\n"
+            for (k, s, e, n, v) in batch
+        )
+
+
+# Format binari: header MAGIC, kemudian setiap rekod
+#   kind (uint8, indeks dalam KINDS), start (float64), end (float64),
+#   value (int64, NO_VALUE jika None), panjang nama (uint16), nama (utf-8)
+MAGIC = b"CPUEVT1\n"
+NO_VALUE = -(2 ** 63)
+_RECORD = struct.Struct("<BddqH")
+_KIND_CODE = {k: i for i, k in enumerate(KINDS)}
+
+
+class BinaryLog(_BackgroundLog):
+    """Compact binary records; read back with read_binary()."""
+
+    mode = "wb"
+
+    def _write_header(self):
+        self._file.write(MAGIC)
+
+    def _encode(self, batch):
+        pack = _RECORD.pack
+        parts = []
+        for (k, s, e, n, v) in batch:
+            raw = n.encode("utf-8")
+            parts.append(pack(_KIND_CODE[k], s, e, NO_VALUE if v is None else v, len(raw)))
+            parts.append(raw)
+        return b"".join(parts)
+
+
+def read_binary(path: str) -> Iterator[Event]:
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path}: not a binary event log")
+    offset = len(MAGIC)
+    unpack = _RECORD.unpack_from
+    while offset < len(data):
+        code, start, end, value, size = unpack(data, offset)
+        offset += _RECORD.size
+        name = data[offset:offset + size].decode("utf-8")
+        offset += size
+        yield (KINDS[code], start, end, name, None if value == NO_VALUE else value)
+
+
+def open_log(path: Optional[str]):
+    """Pilih sink ikut sambungan fail: .jsonl → JsonlLog, lain-lain → BinaryLog; None → NullLog."""
+    if not path:
+        return NullLog()
+    if path.lower().endswith(".jsonl"):
+        return JsonlLog(path)
+    return BinaryLog(path)
@@ -3,6 +3,7 @@
 # for educational purposes only
 
 import simpy
+from eventlog import ConsoleLog, NullLog
 
 # ======================
 # FCFS Simulation Setup
@@ -37,7 +38,8 @@ procs = [
 # FCFS Function
 # ======================
 
-def fcfs(env, processes):
+def fcfs(env, processes, log=None):
+    log = log or NullLog()
     # Sort proses ikut masa tiba
     processes = sorted(processes, key=lambda p: p.arrival)
     time_log = []
@@ -46,7 +48,7 @@ def fcfs(env, processes):
     for p in processes:
         # Jika CPU idle sebelum proses tiba
         if time < p.arrival:
-            print(f"CPU idle from {time} to {p.arrival}")
+            log.emit("idle", time, p.arrival, "IDLE")
             yield env.timeout(p.arrival - time)
             time = p.arrival
 
@@ -55,13 +57,14 @@ def fcfs(env, processes):
 
         start = time
         end = time + p.burst
-        print(f"{p.name} running from {start} to {end}")
+        log.emit("dispatch", start, end, p.name)
 
         time_log.append((start, end, p.name))
 
         yield env.timeout(p.burst)
         time = end
         p.completion_time = time
+        log.emit("complete", time, time, p.name)
 
     return time_log
 
@@ -76,35 +79,36 @@ def gantt_chart(timeline):
 # Run Simulation
 # ======================
 
-# Paparkan semua input proses sebelum sebarang output simulasi
-print("=== Input Processes ===")
-for p in procs:
-    print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}")
-
-print()
-timeline = env.process(fcfs(env, procs))
-env.run()
-
-# ======================
-# Compute Metrics
-# ======================
-
-print("\n=== Metrics ===")
-total_tat = total_wt = total_rt = 0
-for p in procs:
-    tat = p.completion_time - p.arrival
-    wt = tat - p.burst
-    rt = p.response_time
-    total_tat += tat
-    total_wt += wt
-    total_rt += rt
-    print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}, "
-          f"Start={p.start_time}, Completion={p.completion_time}, "
-          f"TAT={tat}, WT={wt}, RT={rt}")
-
-n = len(procs)
-print(f"\nAverage Turnaround Time: {total_tat/n:.2f}")
-print(f"Average Waiting Time: {total_wt/n:.2f}")
-print(f"Average Response Time: {total_rt/n:.2f}")
-
-gantt_chart(timeline.value)
+if __name__ == "__main__":
+    # Paparkan semua input proses sebelum sebarang output simulasi
+    print("=== Input Processes ===")
+    for p in procs:
+        print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}")
+
+    print()
+    timeline = env.process(fcfs(env, procs, log=ConsoleLog()))
+    env.run()
+
+    # ======================
+    # Compute Metrics
+    # ======================
+
+    print("\n=== Metrics ===")
+    total_tat = total_wt = total_rt = 0
+    for p in procs:
+        tat = p.completion_time - p.arrival
+        wt = tat - p.burst
+        rt = p.response_time
+        total_tat += tat
+        total_wt += wt
+        total_rt += rt
+        print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}, "
+              f"Start={p.start_time}, Completion={p.completion_time}, "
+              f"TAT={tat}, WT={wt}, RT={rt}")
+
+    n = len(procs)
+    print(f"\nAverage Turnaround Time: {total_tat/n:.2f}")
+    print(f"Average Waiting Time: {total_wt/n:.2f}")
+    print(f"Average Response Time: {total_rt/n:.2f}")
+
+    gantt_chart(timeline.value)
@@ -0,0 +1,262 @@
+# coded by zainuddin@codemaster.my
+# for educational purposes only
+
+import asyncio
+import heapq
+from collections import deque
+from typing import AsyncIterator, List, Optional, Tuple
+
+# ======================
+# Online Scheduling Setup
+# ======================
+# Berbeza dengan skrip lain, mod ini tidak perlukan senarai proses penuh.
+# Proses tiba melalui async iterator / asyncio.Queue dan diterima bila
+# sampai; setiap keputusan (start, end, name) di-yield serta-merta.
+
+POLICIES = ("fcfs", "sjf", "priority", "rr")
+
+
+class Process:
+    def __init__(self, name: str, arrival: int, burst: int, priority: int = 0):
+        self.name = name
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority  # lower = higher priority
+        self.remaining = burst
+        self.start_time: Optional[int] = None
+        self.completion_time: Optional[int] = None
+        self.response_time: Optional[int] = None
+
+    def __repr__(self):
+        return f"{self.name}(A={self.arrival},B={self.burst},P={self.priority})"
+
+
+# ======================
+# Clocks
+# ======================
+class SimulatedClock:
+    """Masa simulasi: lompat terus, tiada tidur sebenar."""
+
+    def __init__(self):
+        self.now = 0
+
+    async def advance_to(self, t):
+        self.now = max(self.now, t)
+
+
+class WallClock:
+    """
+    Masa sebenar berskala: 1 unit masa = `scale` saat.
+    Keputusan diambil tanpa menunggu arrival akan datang, jadi latency
+    setiap keputusan terhad kepada kerja scheduler itu sendiri.
+    """
+
+    realtime = True
+
+    def __init__(self, scale: float = 1.0):
+        self.scale = scale
+        self._t0: Optional[float] = None
+
+    @property
+    def now(self) -> float:
+        loop = asyncio.get_running_loop()
+        if self._t0 is None:
+            self._t0 = loop.time()
+        return (loop.time() - self._t0) / self.scale
+
+    async def advance_to(self, t):
+        delay = (t - self.now) * self.scale
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# ======================
+# Arrival Feed
+# ======================
+async def from_queue(queue: asyncio.Queue) -> AsyncIterator[Process]:
+    """Tukar asyncio.Queue kepada async iterator; masukkan None untuk tamatkan stream."""
+    while True:
+        p = await queue.get()
+        if p is None:
+            return
+        yield p
+
+
+async def from_iterable(processes) -> AsyncIterator[Process]:
+    for p in sorted(processes, key=lambda p: p.arrival):
+        yield p
+
+
+class _Feed:
+    """
+    Pam arrival dari stream ke 'pending' di latar belakang (task asyncio).
+    Ralat daripada stream disimpan dan dibangkitkan semula dalam run_online,
+    supaya stream yang gagal tidak disangka tamat dengan normal.
+    """
+
+    def __init__(self, source):
+        if isinstance(source, asyncio.Queue):
+            source = from_queue(source)
+        elif not hasattr(source, "__aiter__"):
+            source = from_iterable(source)
+        self.pending: deque = deque()
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self._changed = asyncio.Event()
+        self._task = asyncio.ensure_future(self._pump(source))
+
+    async def _pump(self, source):
+        try:
+            async for p in source:
+                self.pending.append(p)
+                self._changed.set()
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self.done = True
+            self._changed.set()
+
+    def check(self):
+        if self.error is not None:
+            raise self.error
+
+    async def wait_until(self, predicate):
+        while not predicate():
+            self._changed.clear()
+            await self._changed.wait()
+        self.check()
+
+    async def settle(self, now):
+        # Masa simulasi: pastikan semua arrival <= now sudah diterima sebelum buat keputusan
+        await self.wait_until(lambda: self.done or (self.pending and self.pending[-1].arrival > now))
+
+    def cancel(self):
+        self._task.cancel()
+
+
+# ======================
+# Online Scheduler
+# ======================
+async def run_online(source, policy: str = "fcfs", quantum: int = 3,
+                     ctx_overhead: int = 0, clock=None) -> AsyncIterator[Tuple[int, int, str]]:
+    """
+    Async generator: yield (start, end, name) sebaik sahaja setiap keputusan dibuat.
+    policy: "fcfs", "sjf", "priority" (non-preemptive, lower = higher) atau "rr" (quantum).
+    Tie-break sama seperti skrip asal: fcfs/sjf ikut susunan tiba, priority ikut (priority, arrival, name).
+    ctx_overhead: slice CTX selepas proses tamat jika masih ada kerja (seperti priority-non-preemtive.py).
+    clock: SimulatedClock() (default) atau WallClock(scale) untuk shadow stream sebenar.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy {policy!r} (choose from {', '.join(POLICIES)})")
+    clock = clock or SimulatedClock()
+    realtime = getattr(clock, "realtime", False)
+    feed = _Feed(source)
+    ready: list = []            # heap (key, seq, p); deque untuk rr
+    rr_queue: deque = deque()
+    seq = 0
+    now = 0
+
+    def key(p: Process):
+        if policy == "sjf":
+            return (p.burst,)
+        if policy == "priority":
+            return (p.priority, p.arrival, p.name)
+        return (p.arrival,)
+
+    async def admit():
+        nonlocal seq
+        if realtime:
+            await asyncio.sleep(0)      # beri peluang producer yang siap pada saat yang sama
+        else:
+            await feed.settle(now)
+        feed.check()
+        while feed.pending and feed.pending[0].arrival <= now:
+            p = feed.pending.popleft()
+            if policy == "rr":
+                rr_queue.append(p)
+            else:
+                heapq.heappush(ready, (key(p), seq, p))
+                seq += 1
+
+    def has_ready():
+        return bool(rr_queue) if policy == "rr" else bool(ready)
+
+    try:
+        while True:
+            await admit()
+
+            if not has_ready():
+                if feed.pending:
+                    # CPU idle sehingga arrival seterusnya
+                    now = max(now, feed.pending[0].arrival)
+                    await clock.advance_to(now)
+                elif feed.done:
+                    break
+                else:
+                    # Belum tahu bila proses seterusnya tiba — tunggu stream
+                    await feed.wait_until(lambda: feed.pending or feed.done)
+                continue
+
+            if policy == "rr":
+                current = rr_queue.popleft()
+                exec_time = min(quantum, current.remaining)
+            else:
+                current = heapq.heappop(ready)[2]
+                exec_time = current.remaining
+
+            if current.start_time is None:
+                current.start_time = now
+                current.response_time = current.start_time - current.arrival
+
+            start, now = now, now + exec_time
+            yield (start, now, current.name)
+            await clock.advance_to(now)
+            current.remaining -= exec_time
+
+            if current.remaining > 0:
+                # Arrival semasa slice masuk dahulu, kemudian proses yang dipreempt
+                await admit()
+                rr_queue.append(current)
+                continue
+
+            current.completion_time = now
+            if ctx_overhead > 0:
+                if not realtime:
+                    await feed.settle(now)
+                if has_ready() or feed.pending or not feed.done:
+                    yield (now, now + ctx_overhead, "CTX")
+                    now += ctx_overhead
+                    await clock.advance_to(now)
+    finally:
+        feed.cancel()
+
+
+def simulate(processes, policy: str = "fcfs", **kwargs) -> List[Tuple[int, int, str]]:
+    """Jalankan run_online atas senarai biasa dalam masa simulasi dan pulangkan timeline penuh."""
+    async def collect():
+        return [d async for d in run_online(processes, policy, **kwargs)]
+    return asyncio.run(collect())
+
+
+# ======================
+# Run Simulation (demo)
+# ======================
+if __name__ == "__main__":
+    SCALE = 0.05  # 1 unit masa = 0.05 saat
+
+    async def producer(queue: asyncio.Queue, clock: WallClock):
+        # Proses dihantar pada masa sebenar, seperti stream production
+        for name, arrival, burst in [("P1", 0, 5), ("P2", 2, 3), ("P3", 4, 8), ("P4", 10, 6)]:
+            await asyncio.sleep(max(0.0, (arrival - clock.now) * SCALE))
+            await queue.put(Process(name, arrival, burst))
+        await queue.put(None)
+
+    async def main():
+        queue: asyncio.Queue = asyncio.Queue()
+        clock = WallClock(SCALE)
+        asyncio.ensure_future(producer(queue, clock))
+        print("=== Online Decisions (RR, quantum=2) ===")
+        async for (st, en, name) in run_online(queue, "rr", quantum=2, clock=clock):
+            print(f"[t={clock.now:5.1f}] {name}: {st} → {en}")
+
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+# coded by zainuddin@codemaster.my
+# for educational purposes only
+
+from typing import Callable, Dict, Optional
+
+# ======================
+# Burst Predictors (untuk SJF / SRTF)
+# ======================
+# Dalam sistem sebenar burst tidak diketahui terlebih dahulu. Scheduler
+# memanggil predict(p) sekali bila proses masuk ready queue, dan
+# observe(p, burst) bila proses siap. Kedua-duanya O(1), jadi ramalan
+# yang dikemaskini tidak memerlukan ready queue disusun semula.
+
+
+class BurstPredictor:
+    """Interface: predict(p) → anggaran burst; observe(p, actual) selepas proses siap."""
+
+    def predict(self, p) -> float:
+        raise NotImplementedError
+
+    def observe(self, p, actual: int) -> None:
+        pass
+
+
+class Oracle(BurstPredictor):
+    """Tahu burst sebenar — sama seperti SJF/SRTF asal (had bawah yang tak realistik)."""
+
+    def predict(self, p) -> float:
+        return p.burst
+
+
+class ExponentialAverage(BurstPredictor):
+    """
+    tau(n+1) = alpha * t(n) + (1 - alpha) * tau(n), satu tau bagi setiap kelas proses.
+    Kelas default = p.category (None = semua proses berkongsi satu anggaran).
+    """
+
+    def __init__(self, alpha: float = 0.5, initial: float = 5.0,
+                 key: Optional[Callable] = None):
+        self.alpha = alpha
+        self.initial = initial
+        self.key = key or (lambda p: getattr(p, "category", None))
+        self.tau: Dict[object, float] = {}
+
+    def predict(self, p) -> float:
+        return self.tau.get(self.key(p), self.initial)
+
+    def observe(self, p, actual: int) -> None:
+        k = self.key(p)
+        self.tau[k] = self.alpha * actual + (1 - self.alpha) * self.tau.get(k, self.initial)
+
+
+def prediction_error(processes) -> float:
+    """Mean absolute error antara p.predicted dan burst sebenar."""
+    errors = [abs(p.predicted - p.burst) for p in processes if getattr(p, "predicted", None) is not None]
+    return sum(errors) / len(errors) if errors else 0.0
+
+
+def _avg_wait(processes) -> float:
+    return sum(p.completion_time - p.arrival - p.burst for p in processes) / len(processes)
+
+
+def compare_with_oracle(processes, scheduler, **kwargs) -> Dict[str, float]:
+    """
+    Jalankan `scheduler` (cth. sjf_non_preemptive, srtf) sekali lagi tanpa predictor atas
+    salinan baru `processes`, dan banding dengan run yang sudah siap (guna ramalan).
+    kwargs: parameter lain untuk scheduler (cth. ctx_overhead).
+    Pulangkan error, wt, oracle_wt, extra_wt (= wt - oracle_wt).
+    """
+    import simpy
+    oracle = [type(p)(p.name, p.arrival, p.burst, p.category) for p in processes]
+    env = simpy.Environment()
+    env.process(scheduler(env, oracle, **kwargs))
+    env.run()
+    wt, oracle_wt = _avg_wait(processes), _avg_wait(oracle)
+    return {"error": prediction_error(processes), "wt": wt,
+            "oracle_wt": oracle_wt, "extra_wt": wt - oracle_wt}
+
+
+def oracle_report(processes, scheduler, **kwargs):
+    """Cetak perbandingan compare_with_oracle() dalam format skrip."""
+    cmp = compare_with_oracle(processes, scheduler, **kwargs)
+    print("\n=== Burst Prediction ===")
+    print(f"Mean absolute prediction error: {cmp['error']:.2f}")
+    print(f"Average Waiting Time (oracle):  {cmp['oracle_wt']:.2f}")
+    print(f"Extra waiting from prediction:  {cmp['extra_wt']:.2f}")
@@ -3,6 +3,8 @@
 # for educational purposes only
 
 import simpy
+from eventlog import ConsoleLog, NullLog
+from switchcost import resolve
 from typing import List, Tuple, Optional
 
 # ======================
@@ -38,17 +40,25 @@ procs: List[Process] = [
 ]
 
 # Context switch delay (unit masa) jika perlu
+# atau guna model kos:
+#   from switchcost import CacheWarmthCost
+#   CTX = CacheWarmthCost(base=1, decay=10)
 CTX = 0
 
 
 # ======================
 # Priority Non-Preemptive Function
 # ======================
-def priority_non_preemptive(env: simpy.Environment, processes: List[Process], ctx_overhead: int = 0):
+def priority_non_preemptive(env: simpy.Environment, processes: List[Process], ctx_overhead: int = 0,
+                            log: Optional[NullLog] = None):
     """
     Priority scheduling (non-preemptive)
     lower number = higher priority
+    ctx_overhead: CTX tetap (int) atau model kos switch (lihat switchcost.py).
     """
+    log = log or NullLog()
+    switch = resolve(ctx_overhead)
+    warming = False   # switch berlaku; warmup dicaj bila proses seterusnya dipilih
     timeline: List[Tuple[int, int, str]] = []
     processes = sorted(processes, key=lambda p: (p.arrival, p.priority, p.name))
     ready: List[Process] = []
@@ -65,7 +75,7 @@ def priority_non_preemptive(env: simpy.Environment, processes: List[Process], ct
         if not ready:
             # Tiada proses — CPU idle
             next_arrival = processes[i].arrival
-            print(f"CPU idle from {time} to {next_arrival}")
+            log.emit("idle", time, next_arrival, "IDLE")
             yield env.timeout(next_arrival - time)
             time = next_arrival
             continue
@@ -74,24 +84,43 @@ def priority_non_preemptive(env: simpy.Environment, processes: List[Process], ct
         ready.sort(key=lambda p: (p.priority, p.arrival, p.name))
         current = ready.pop(0)
 
+        # Warmup (cache reload/migrasi) untuk proses yang benar-benar dipilih
+        if warming:
+            warming = False
+            warmup = switch.warmup(current, time)
+            if warmup > 0:
+                if timeline and timeline[-1][2] == "CTX" and timeline[-1][1] == time:
+                    timeline[-1] = (timeline[-1][0], time + warmup, "CTX")
+                else:
+                    timeline.append((time, time + warmup, "CTX"))
+                log.emit("ctx", time, time + warmup, "CTX")
+                yield env.timeout(warmup)
+                time += warmup
+
         # Mula proses
         current.start_time = time
         current.response_time = current.start_time - current.arrival
 
         start = time
         end = time + current.burst
-        print(f"{current.name} running from {start} to {end} (Priority {current.priority})")
+        log.emit("dispatch", start, end, current.name, current.priority)
 
         timeline.append((start, end, current.name))
         yield env.timeout(current.burst)
         time = end
         current.completion_time = time
+        log.emit("complete", time, time, current.name)
 
         # Context switch delay jika ada
-        if ctx_overhead > 0 and (ready or i < n):
-            timeline.append((time, time + ctx_overhead, "CTX"))
-            yield env.timeout(ctx_overhead)
-            time += ctx_overhead
+        if switch and (ready or i < n):
+            switch.ran(current, time)
+            warming = True
+            cost = switch.cost(time)
+            if cost > 0:
+                timeline.append((time, time + cost, "CTX"))
+                log.emit("ctx", time, time + cost, "CTX")
+                yield env.timeout(cost)
+                time += cost
 
     return timeline
 
@@ -106,34 +135,35 @@ def gantt_chart(timeline: List[Tuple[int, int, str]]):
 # Run Simulation
 # ======================
 
-# Paparkan semua input proses sebelum sebarang output simulasi
-print("=== Input Processes ===")
-for p in procs:
-    print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}, Priority={p.priority}")
-
-print()
-timeline = env.process(priority_non_preemptive(env, procs, ctx_overhead=CTX))
-env.run()
-
-# ======================
-# Compute Metrics
-# ======================
-print("\n=== Metrics ===")
-tot_tat = tot_wt = tot_rt = 0.0
-for p in procs:
-    tat = p.completion_time - p.arrival
-    wt = tat - p.burst
-    rt = p.response_time
-    tot_tat += tat
-    tot_wt += wt
-    tot_rt += rt
-    print(f"{p.name} | A={p.arrival}, B={p.burst}, P={p.priority}, "
-          f"Start={p.start_time}, Complete={p.completion_time}, "
-          f"TAT={tat}, WT={wt}, RT={rt}")
-
-n = len(procs)
-print(f"\nAverage Turnaround Time: {tot_tat/n:.2f}")
-print(f"Average Waiting Time:    {tot_wt/n:.2f}")
-print(f"Average Response Time:   {tot_rt/n:.2f}")
-
-gantt_chart(timeline.value)
+if __name__ == "__main__":
+    # Paparkan semua input proses sebelum sebarang output simulasi
+    print("=== Input Processes ===")
+    for p in procs:
+        print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}, Priority={p.priority}")
+
+    print()
+    timeline = env.process(priority_non_preemptive(env, procs, ctx_overhead=CTX, log=ConsoleLog("Priority")))
+    env.run()
+
+    # ======================
+    # Compute Metrics
+    # ======================
+    print("\n=== Metrics ===")
+    tot_tat = tot_wt = tot_rt = 0.0
+    for p in procs:
+        tat = p.completion_time - p.arrival
+        wt = tat - p.burst
+        rt = p.response_time
+        tot_tat += tat
+        tot_wt += wt
+        tot_rt += rt
+        print(f"{p.name} | A={p.arrival}, B={p.burst}, P={p.priority}, "
+              f"Start={p.start_time}, Complete={p.completion_time}, "
+              f"TAT={tat}, WT={wt}, RT={rt}")
+
+    n = len(procs)
+    print(f"\nAverage Turnaround Time: {tot_tat/n:.2f}")
+    print(f"Average Waiting Time:    {tot_wt/n:.2f}")
+    print(f"Average Response Time:   {tot_rt/n:.2f}")
+
+    gantt_chart(timeline.value)
@@ -3,7 +3,9 @@
 # for educational purposes only
 
 import simpy
+from eventlog import NullLog
 from typing import List, Tuple, Optional
+from switchcost import resolve
 
 # ======================
 # Priority Preemptive Setup
@@ -15,6 +17,7 @@ class Process:
         self.arrival = arrival
         self.burst = burst
         self.priority = priority  # lower = higher priority
+        self.base_priority = priority  # priority asal (aging hanya ubah self.priority)
         self.remaining = burst
         self.start_time: Optional[int] = None
         self.completion_time: Optional[int] = None
@@ -40,6 +43,9 @@ procs: List[Process] = [
 ]
 
 # Context switch overhead (unit masa). Tetapkan 0 jika tak perlu.
+# Atau guna model kos:
+#   from switchcost import CacheWarmthCost
+#   CTX = CacheWarmthCost(base=1, decay=10)
 CTX = 0
 
 # Pilihan aging untuk kurangkan starvation (False untuk matikan).
@@ -53,13 +59,16 @@ AGING_STEP = 1          # kurangkan nilai priority sebanyak 1 (menaikkan priorit
 # ======================
 def priority_preemptive(env: simpy.Environment, processes: List[Process],
                         ctx_overhead: int = 0, aging: bool = False,
-                        aging_interval: int = 5, aging_step: int = 1):
+                        aging_interval: int = 5, aging_step: int = 1, log: Optional[NullLog] = None):
     """
     Priority (preemptive): lower number = higher priority.
     Preempt jika ada proses ready dengan priority < priority proses semasa.
     Tie-break: priority, arrival, name.
     Aging (optional): setiap 'aging_interval' masa menunggu, kurangkan nilai priority (min 1).
+    ctx_overhead: CTX tetap (int) atau model kos switch (lihat switchcost.py).
+    log: sink eventlog; "dispatch" dihantar bila setiap segmen Gantt ditutup (value = priority).
     """
+    log = log or NullLog()
     timeline: List[Tuple[int, int, str]] = []   # (start, end, name/CTX/IDLE)
     processes = sorted(processes, key=lambda p: (p.arrival, p.name))
     ready: List[Process] = []
@@ -68,6 +77,8 @@ def priority_preemptive(env: simpy.Environment, processes: List[Process],
 
     current: Optional[Process] = None
     slice_start: Optional[int] = None
+    switch = resolve(ctx_overhead)
+    warming = False   # switch berlaku; warmup dicaj pada dispatch seterusnya
 
     def enqueue(p: Process, now: int):
         p.last_enqueued_at = now
@@ -104,9 +115,36 @@ def priority_preemptive(env: simpy.Environment, processes: List[Process],
                 return True
         return False
 
-    def close_slice(until_time: int, pid: str):
+    def close_slice(until_time: int, p: Process):
         if slice_start is not None and until_time > slice_start:
-            timeline.append((slice_start, until_time, pid))
+            timeline.append((slice_start, until_time, p.name))
+            log.emit("dispatch", slice_start, until_time, p.name, p.priority)
+
+    def charge(cost: int, extend: bool = False):
+        # Slice CTX; warmup menyambung slice CTX switch yang baru tamat
+        if cost > 0:
+            if extend and timeline and timeline[-1][2] == "CTX" and timeline[-1][1] == env.now:
+                timeline[-1] = (timeline[-1][0], env.now + cost, "CTX")
+            else:
+                timeline.append((env.now, env.now + cost, "CTX"))
+            log.emit("ctx", env.now, env.now + cost, "CTX")
+            yield env.timeout(cost)
+
+    def context_switch(outgoing: Process, ran_since: Optional[int]):
+        # outgoing berhenti; kos warmup menunggu proses yang benar-benar di-dispatch
+        nonlocal warming
+        if switch is None:
+            return
+        if ran_since is not None and env.now > ran_since:
+            switch.ran(outgoing, env.now)
+        warming = True
+        yield from charge(switch.cost(env.now))
+
+    def dispatch(p: Process):
+        nonlocal warming
+        if warming:
+            warming = False
+            yield from charge(switch.warmup(p, env.now), extend=True)
 
     while i < n or ready or current:
         # Masukkan proses yang sudah tiba pada masa sekarang
@@ -123,11 +161,10 @@ def priority_preemptive(env: simpy.Environment, processes: List[Process],
             cand = ready[0]
             if is_higher(cand, current):
                 # tutup segmen semasa
-                close_slice(env.now, current.name)
+                close_slice(env.now, current)
+                log.emit("preempt", env.now, env.now, current.name, current.remaining)
                 # context switch jika ada
-                if ctx_overhead > 0:
-                    timeline.append((env.now, env.now + ctx_overhead, "CTX"))
-                    yield env.timeout(ctx_overhead)
+                yield from context_switch(current, slice_start)
                 # letak current kembali ke ready
                 enqueue(current, env.now)
                 current = None
@@ -138,6 +175,7 @@ def priority_preemptive(env: simpy.Environment, processes: List[Process],
             next_arrival = processes[i].arrival
             if env.now < next_arrival:
                 timeline.append((env.now, next_arrival, "IDLE"))
+                log.emit("idle", env.now, next_arrival, "IDLE")
                 yield env.timeout(next_arrival - env.now)
             continue
 
@@ -147,6 +185,7 @@ def priority_preemptive(env: simpy.Environment, processes: List[Process],
             if current is None and i >= n:
                 break
             if current:
+                yield from dispatch(current)
                 if current.start_time is None:
                     current.start_time = env.now
                     current.response_time = current.start_time - current.arrival
@@ -159,14 +198,14 @@ def priority_preemptive(env: simpy.Environment, processes: List[Process],
 
             if current.remaining == 0:
                 # tamatkan proses semasa
-                close_slice(env.now, current.name)
+                close_slice(env.now, current)
                 current.completion_time = env.now
-                current = None
-                slice_start = None
+                log.emit("complete", env.now, env.now, current.name)
+                done, current = current, None
+                done_since, slice_start = slice_start, None
                 # context switch selepas tamat proses (jika masih ada kerja)
-                if ctx_overhead > 0 and (ready or i < n):
-                    timeline.append((env.now, env.now + ctx_overhead, "CTX"))
-                    yield env.timeout(ctx_overhead)
+                if ready or i < n:
+                    yield from context_switch(done, done_since)
             else:
                 # semak arrival baru (untuk peluang preempt segera)
                 while i < n and processes[i].arrival <= env.now:
@@ -177,12 +216,12 @@ def priority_preemptive(env: simpy.Environment, processes: List[Process],
                     ready.sort(key=lambda p: (p.priority, p.arrival, p.name))
                     cand = ready[0]
                     if is_higher(cand, current):
-                        close_slice(env.now, current.name)
-                        if ctx_overhead > 0:
-                            timeline.append((env.now, env.now + ctx_overhead, "CTX"))
-                            yield env.timeout(ctx_overhead)
+                        close_slice(env.now, current)
+                        log.emit("preempt", env.now, env.now, current.name, current.remaining)
+                        yield from context_switch(current, slice_start)
                         enqueue(current, env.now)
                         current = ready.pop(0)
+                        yield from dispatch(current)
                         if current.start_time is None:
                             current.start_time = env.now
                             current.response_time = current.start_time - current.arrival
@@ -201,37 +240,38 @@ def gantt_chart(timeline: List[Tuple[int, int, str]]):
 # Run Simulation
 # ======================
 
-# Paparkan semua input proses sebelum sebarang output simulasi
-print("=== Input Processes ===")
-for p in procs:
-    print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}, Priority={p.priority}")
-
-print()
-timeline = env.process(
-    priority_preemptive(env, procs, ctx_overhead=CTX, aging=AGING,
-                        aging_interval=AGING_INTERVAL, aging_step=AGING_STEP)
-)
-env.run()
-
-# ======================
-# Compute Metrics
-# ======================
-print("\n=== Metrics ===")
-tot_tat = tot_wt = tot_rt = 0.0
-for p in procs:
-    tat = p.completion_time - p.arrival
-    wt = tat - p.burst
-    rt = p.response_time
-    tot_tat += tat
-    tot_wt += wt
-    tot_rt += rt
-    print(f"{p.name} | A={p.arrival}, B={p.burst}, P={p.priority}, "
-          f"Start={p.start_time}, Complete={p.completion_time}, "
-          f"TAT={tat}, WT={wt}, RT={rt}")
-
-n = len(procs)
-print(f"\nAverage Turnaround Time: {tot_tat/n:.2f}")
-print(f"Average Waiting Time:    {tot_wt/n:.2f}")
-print(f"Average Response Time:   {tot_rt/n:.2f}")
-
-gantt_chart(timeline.value)
+if __name__ == "__main__":
+    # Paparkan semua input proses sebelum sebarang output simulasi
+    print("=== Input Processes ===")
+    for p in procs:
+        print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}, Priority={p.priority}")
+
+    print()
+    timeline = env.process(
+        priority_preemptive(env, procs, ctx_overhead=CTX, aging=AGING,
+                            aging_interval=AGING_INTERVAL, aging_step=AGING_STEP)
+    )
+    env.run()
+
+    # ======================
+    # Compute Metrics
+    # ======================
+    print("\n=== Metrics ===")
+    tot_tat = tot_wt = tot_rt = 0.0
+    for p in procs:
+        tat = p.completion_time - p.arrival
+        wt = tat - p.burst
+        rt = p.response_time
+        tot_tat += tat
+        tot_wt += wt
+        tot_rt += rt
+        print(f"{p.name} | A={p.arrival}, B={p.burst}, P={p.priority}, "
+              f"Start={p.start_time}, Complete={p.completion_time}, "
+              f"TAT={tat}, WT={wt}, RT={rt}")
+
+    n = len(procs)
+    print(f"\nAverage Turnaround Time: {tot_tat/n:.2f}")
+    print(f"Average Waiting Time:    {tot_wt/n:.2f}")
+    print(f"Average Response Time:   {tot_rt/n:.2f}")
+
+    gantt_chart(timeline.value)
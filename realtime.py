@@ -0,0 +1,308 @@
+# pip install simpy
+# coded by zainuddin@codemaster.my
+# for educational purposes only
+
+import heapq
+import itertools
+import math
+import simpy
+from functools import reduce
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+# ======================
+# Real-Time (EDF / Rate Monotonic) Setup
+# ======================
+
+class Task:
+    """
+    Periodic task: job dilepaskan pada offset + k*period.
+    Sporadic task: beri 'releases' (masa lepas, menaik); 'period' = jarak minimum antara job.
+    'releases' mesti boleh diulang supaya setiap run (EDF, kemudian RM) bermula dari job
+    pertama: senarai/range, atau fungsi tanpa argumen yang pulangkan iterator baru
+    (stream lazy, tiada salinan dalam memori — tetapi HORIZON mesti diberi).
+    Deadline relatif default = period (implicit deadline).
+    """
+
+    def __init__(self, name: str, wcet: int, period: int, deadline: Optional[int] = None,
+                 offset: int = 0, releases: Union[Iterable[int], Callable[[], Iterable[int]], None] = None):
+        if releases is not None and not callable(releases) and iter(releases) is releases:
+            raise ValueError(f"{name}: releases is a one-shot iterator; "
+                             "pass a list or a zero-argument function that returns a new iterator")
+        self.name = name
+        self.wcet = wcet
+        self.period = period
+        self.deadline = period if deadline is None else deadline
+        self.offset = offset
+        self.releases = releases
+        self.reset()
+
+    def reset(self):
+        # Statistik per task (memori terhad walau berjuta job)
+        self.released = 0
+        self.completed = 0
+        self.misses = 0
+        self.max_lateness = 0
+        self.total_response = 0
+        self.missed: List[Tuple[str, int, Optional[int]]] = []   # (job, deadline, completion/None)
+
+    def release_times(self) -> Iterator[int]:
+        """Masa lepas job, dijana secara lazy (tiada senarai semua instance)."""
+        if self.releases is None:
+            return (self.offset + k * self.period for k in itertools.count())
+        return self._sporadic()
+
+    def _sporadic(self) -> Iterator[int]:
+        last = None
+        for t in (self.releases() if callable(self.releases) else self.releases):
+            if last is not None and t - last < self.period:
+                raise ValueError(f"{self.name}: release {t} is closer than period {self.period} to {last}")
+            last = t
+            yield t
+
+    def __repr__(self):
+        return f"{self.name}(C={self.wcet},T={self.period},D={self.deadline})"
+
+
+class Job:
+    __slots__ = ("task", "name", "release", "deadline", "remaining", "start_time")
+
+    def __init__(self, task: Task, k: int, release: int):
+        self.task = task
+        self.name = f"{task.name}#{k}"
+        self.release = release
+        self.deadline = release + task.deadline
+        self.remaining = task.wcet
+        self.start_time: Optional[int] = None
+
+
+# ======================
+# Parameter (boleh ubah)
+# ======================
+
+# Senarai task: (Nama, WCET, Period[, Deadline, Offset, Releases])
+tasks: List[Task] = [
+    Task("T1", 2, 5),
+    Task("T2", 4, 7),
+    # Task("T3", 1, 10, releases=[0, 12, 30]),   # sporadic
+]
+
+HORIZON = None   # None = hyperperiod (LCM period) + offset maksimum, dilanjutkan ke deadline job sporadic terakhir
+
+MISSES_KEPT = 100   # berapa contoh deadline miss disimpan bagi setiap task
+
+
+# ======================
+# Schedulability Tests
+# ======================
+def utilization(tasks: List[Task]) -> float:
+    return sum(t.wcet / t.period for t in tasks)
+
+
+def edf_test(tasks: List[Task]) -> Tuple[bool, str]:
+    """EDF: U <= 1 tepat untuk implicit deadline; density Σ C/min(D,T) <= 1 (cukup) jika D < T."""
+    if all(t.deadline >= t.period for t in tasks):
+        u = utilization(tasks)
+        return u <= 1, f"U = {u:.3f} {'<=' if u <= 1 else '>'} 1"
+    density = sum(t.wcet / min(t.deadline, t.period) for t in tasks)
+    if density <= 1:
+        return True, f"density = {density:.3f} <= 1 (D < T, sufficient test)"
+    return False, f"density = {density:.3f} > 1 (D < T, sufficient test only — may still be schedulable)"
+
+
+def rm_test(tasks: List[Task]) -> Tuple[bool, str]:
+    """
+    Rate Monotonic: cuba Liu & Layland (U <= n(2^(1/n) - 1)); jika gagal,
+    guna response-time analysis yang tepat: R = C + Σ ceil(R/Tj)·Cj bagi task priority lebih tinggi.
+    """
+    n = len(tasks)
+    u = utilization(tasks)
+    bound = n * (2 ** (1 / n) - 1) if n else 1.0
+    constrained = any(t.deadline < t.period for t in tasks)
+    if u <= bound and not constrained:
+        return True, f"U = {u:.3f} <= Liu-Layland bound {bound:.3f}"
+    why = "D < T" if constrained else f"U = {u:.3f} > Liu-Layland bound {bound:.3f}"
+
+    ordered = sorted(tasks, key=lambda t: (t.period, t.name))
+    for i, task in enumerate(ordered):
+        higher = ordered[:i]
+        r = task.wcet
+        while True:
+            nxt = task.wcet + sum(math.ceil(r / h.period) * h.wcet for h in higher)
+            if nxt == r or nxt > task.deadline:
+                break
+            r = nxt
+        if nxt > task.deadline:
+            return False, f"response time of {task.name} exceeds deadline {task.deadline} ({why}, so RTA used)"
+    return True, f"response-time analysis passes ({why}, so RTA used)"
+
+
+def hyperperiod(tasks: List[Task]) -> int:
+    return reduce(lambda a, b: a * b // math.gcd(a, b), (t.period for t in tasks), 1) + \
+        max((t.offset for t in tasks), default=0)
+
+
+def default_horizon(tasks: List[Task]) -> int:
+    """
+    Hyperperiod, atau lebih panjang supaya setiap job sporadic dilepaskan dan deadline-nya disemak.
+    Stream sporadic (fungsi) tiada penghujung yang diketahui, jadi horizon mesti diberi.
+    """
+    horizon = hyperperiod(tasks)
+    for t in tasks:
+        if callable(t.releases):
+            raise ValueError(f"{t.name}: sporadic release stream needs an explicit horizon")
+        if t.releases:
+            horizon = max(horizon, max(t.releases) + t.deadline)
+    return horizon
+
+
+# ======================
+# Real-Time Scheduler
+# ======================
+def _realtime(env: simpy.Environment, tasks: List[Task], horizon: int, key):
+    """
+    Preemptive, event-driven: jalan job semasa sehingga ia siap atau release seterusnya.
+    Release job diletak dalam heap (satu entri bagi setiap task) dan dijana bila perlu.
+    Ready queue juga heap ikut key(job); tie-break: release, nama task.
+    Job lewat tetap dijalankan (soft real-time) dan dikira sebagai deadline miss.
+    """
+    timeline: List[Tuple[int, int, str]] = []   # (start, end, name/IDLE)
+    upcoming: List[Tuple[int, int, int, Iterator[int]]] = []   # (release, task idx, k, iterator)
+    for idx, task in enumerate(tasks):
+        task.reset()
+        it = task.release_times()
+        first = next(it, None)
+        if first is not None:
+            upcoming.append((first, idx, 0, it))
+    heapq.heapify(upcoming)
+
+    ready: List[Tuple[tuple, Job]] = []
+    current: Optional[Job] = None
+    slice_start: Optional[int] = None
+
+    def entry(job: Job):
+        return (key(job), job.release, job.task.name), job
+
+    def close_slice(until_time: int):
+        if current is not None and until_time > slice_start:
+            timeline.append((slice_start, until_time, current.task.name))
+
+    def finish(job: Job, completion: Optional[int]):
+        task = job.task
+        if completion is not None:
+            task.completed += 1
+            task.total_response += completion - job.release
+        lateness = (horizon if completion is None else completion) - job.deadline
+        # Job yang belum siap dan deadline-nya <= horizon tetap miss, walaupun lateness = 0
+        if lateness > 0 or (completion is None and job.deadline <= horizon):
+            task.misses += 1
+            task.max_lateness = max(task.max_lateness, lateness)
+            if len(task.missed) < MISSES_KEPT:
+                task.missed.append((job.name, job.deadline, completion))
+
+    while True:
+        # Lepaskan semua job yang sudah tiba
+        while upcoming and upcoming[0][0] <= env.now and upcoming[0][0] < horizon:
+            release, idx, k, it = heapq.heappop(upcoming)
+            task = tasks[idx]
+            task.released += 1
+            heapq.heappush(ready, entry(Job(task, k, release)))
+            nxt = next(it, None)
+            if nxt is not None:
+                heapq.heappush(upcoming, (nxt, idx, k + 1, it))
+
+        # Preempt jika job di depan ready lebih mendesak
+        if current is not None and ready and ready[0][0] < entry(current)[0]:
+            close_slice(env.now)
+            heapq.heappush(ready, entry(current))
+            current = None
+
+        if current is None and ready:
+            current = heapq.heappop(ready)[1]
+            if current.start_time is None:
+                current.start_time = env.now
+            slice_start = env.now
+
+        next_release = upcoming[0][0] if upcoming else math.inf
+        stop = min(next_release, horizon)
+        if env.now >= horizon:
+            break
+
+        if current is None:
+            if stop == math.inf:
+                break
+            # Tiada job — CPU idle sehingga release seterusnya
+            timeline.append((env.now, stop, "IDLE"))
+            yield env.timeout(stop - env.now)
+            continue
+
+        # Jalan sehingga job siap atau release seterusnya (peluang preempt)
+        start = env.now
+        run_until = min(start + current.remaining, stop)
+        yield env.timeout(run_until - start)
+        current.remaining -= run_until - start
+
+        if current.remaining == 0:
+            close_slice(env.now)
+            finish(current, env.now)
+            current = None
+
+    # Horizon: job yang belum siap dan sudah lepas deadline dikira miss
+    if current is not None:
+        close_slice(env.now)
+        finish(current, None)
+    for _, job in ready:
+        finish(job, None)
+    return timeline
+
+
+def edf(env: simpy.Environment, tasks: List[Task], horizon: Optional[int] = None):
+    """Earliest Deadline First: job dengan deadline mutlak paling awal dijalankan dahulu."""
+    return _realtime(env, tasks, horizon or default_horizon(tasks), key=lambda job: job.deadline)
+
+
+def rate_monotonic(env: simpy.Environment, tasks: List[Task], horizon: Optional[int] = None):
+    """Rate Monotonic: priority statik, period lebih pendek = priority lebih tinggi."""
+    return _realtime(env, tasks, horizon or default_horizon(tasks), key=lambda job: job.task.period)
+
+
+def gantt_chart(timeline: List[Tuple[int, int, str]]):
+    print("\n=== Gantt Chart ===")
+    for (st, en, name) in timeline:
+        print(f"{name}: {st} → {en}")
+
+
+def report(tasks: List[Task]):
+    print("\n=== Deadline Report ===")
+    for t in tasks:
+        avg_rt = t.total_response / t.completed if t.completed else 0.0
+        print(f"{t.name} | C={t.wcet}, T={t.period}, D={t.deadline} | "
+              f"Released={t.released}, Completed={t.completed}, Misses={t.misses}, "
+              f"MaxLateness={t.max_lateness}, AvgResponse={avg_rt:.2f}")
+        for (job, deadline, completion) in t.missed[:5]:
+            done = "not finished" if completion is None else f"finished at {completion}"
+            print(f"    {job} missed deadline {deadline} ({done})")
+
+
+# ======================
+# Run Simulation
+# ======================
+
+if __name__ == "__main__":
+    # Paparkan semua input task sebelum sebarang output simulasi
+    print("=== Input Tasks ===")
+    for t in tasks:
+        kind = "sporadic" if t.releases is not None else "periodic"
+        print(f"{t.name} | WCET={t.wcet}, Period={t.period}, Deadline={t.deadline}, Offset={t.offset} ({kind})")
+    print(f"\nUtilization: {utilization(tasks):.3f}")
+
+    for label, scheduler, test in (("EDF", edf, edf_test), ("Rate Monotonic", rate_monotonic, rm_test)):
+        ok, reason = test(tasks)
+        print(f"\n##### {label} #####")
+        print(f"Schedulability test: {'PASS' if ok else 'FAIL'} — {reason}")
+
+        env = simpy.Environment()
+        timeline = env.process(scheduler(env, tasks, horizon=HORIZON))
+        env.run()
+
+        report(tasks)
+        gantt_chart(timeline.value)
@@ -3,6 +3,7 @@
 # for educational purposes only
 
 import simpy
+from eventlog import ConsoleLog, NullLog
 from collections import deque
 
 # ======================
@@ -20,12 +21,48 @@ class Process:
         self.response_time = None
 
 
+class AdaptiveQuantum:
+    """
+    Quantum yang menyesuaikan diri secara online daripada burst yang diperhati.
+    Anggar persentil 'target' bagi burst (stochastic quantile tracking), jadi
+    lebih kurang 'target' daripada proses siap dalam satu slice.
+    Setiap observe() O(1); langkah diskala ikut purata burst (EWMA).
+    """
+
+    def __init__(self, initial=3, target=0.8, rate=0.05, minimum=1):
+        self.estimate = float(initial)
+        self.mean = float(initial)
+        self.target = target
+        self.rate = rate
+        self.minimum = minimum
+        self.history = [(0, self.value)]   # (masa, quantum) setiap kali nilai berubah
+
+    @property
+    def value(self):
+        return max(self.minimum, round(self.estimate))
+
+    def observe(self, burst, now=0):
+        before = self.value
+        self.mean += self.rate * (burst - self.mean)
+        step = self.rate * self.mean
+        if burst <= self.estimate:
+            self.estimate -= step * (1 - self.target)
+        else:
+            self.estimate += step * self.target
+        if self.value != before:
+            self.history.append((now, self.value))
+
+
 # ======================
 # Parameter (boleh ubah)
 # ======================
 
 env = simpy.Environment()
 quantum = 3  # ubah nilai quantum di sini
+
+# Quantum adaptif (False = quantum tetap)
+ADAPTIVE = False
+TARGET_FRACTION = 0.8   # sasaran: 80% proses siap dalam satu slice
 procs = [
     Process("P1", 0, 10),
     Process("P2", 2, 6),
@@ -37,7 +74,10 @@ procs = [
 # Round Robin Function
 # ======================
 
-def round_robin(env, processes, quantum):
+def round_robin(env, processes, quantum, log=None):
+    # quantum: nombor tetap, atau AdaptiveQuantum untuk mod adaptif
+    log = log or NullLog()
+    adaptive = hasattr(quantum, "observe")
     queue = deque()
     time_log = []
     processes = sorted(processes, key=lambda p: p.arrival)
@@ -51,6 +91,7 @@ def round_robin(env, processes, quantum):
 
         if not queue:
             next_arrival = processes[i].arrival
+            log.emit("idle", env.now, next_arrival, "IDLE")
             yield env.timeout(next_arrival - env.now)
             continue
 
@@ -60,10 +101,10 @@ def round_robin(env, processes, quantum):
             current.start_time = env.now
             current.response_time = current.start_time - current.arrival
 
-        exec_time = min(quantum, current.remaining)
+        exec_time = min(quantum.value if adaptive else quantum, current.remaining)
         start = env.now
         end = env.now + exec_time
-        print(f"{current.name} running from {start} to {end} (remaining {current.remaining - exec_time})")
+        log.emit("dispatch", start, end, current.name, current.remaining - exec_time)
 
         time_log.append((start, end, current.name))
         yield env.timeout(exec_time)
@@ -76,12 +117,24 @@ def round_robin(env, processes, quantum):
 
         if current.remaining > 0:
             queue.append(current)
+            log.emit("preempt", env.now, env.now, current.name, current.remaining)
         else:
             current.completion_time = env.now
+            log.emit("complete", env.now, env.now, current.name)
+            if adaptive:
+                quantum.observe(current.burst, env.now)
 
     return time_log
 
 
+def tradeoff(timeline, processes):
+    """Context switch (tukar proses antara slice), kadar per unit masa, dan purata response time."""
+    switches = sum(1 for a, b in zip(timeline, timeline[1:]) if a[2] != b[2])
+    makespan = (timeline[-1][1] - timeline[0][0]) if timeline else 0
+    avg_rt = sum(p.response_time for p in processes) / len(processes) if processes else 0.0
+    return switches, (switches / makespan if makespan else 0.0), avg_rt
+
+
 def gantt_chart(timeline):
     print("\n=== Gantt Chart ===")
     for (st, en, name) in timeline:
@@ -92,31 +145,41 @@ def gantt_chart(timeline):
 # Run Simulation
 # ======================
 
-# Paparkan semua input proses sebelum sebarang output simulasi
-print("=== Input Processes ===")
-for p in procs:
-    print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}")
-
-print()
-timeline = env.process(round_robin(env, procs, quantum))
-env.run()
-
-print("\n=== Metrics ===")
-total_tat = total_wt = total_rt = 0
-for p in procs:
-    tat = p.completion_time - p.arrival
-    wt = tat - p.burst
-    rt = p.response_time
-    total_tat += tat
-    total_wt += wt
-    total_rt += rt
-    print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}, "
-          f"Start={p.start_time}, Completion={p.completion_time}, "
-          f"TAT={tat}, WT={wt}, RT={rt}")
-
-n = len(procs)
-print(f"\nAverage Turnaround Time: {total_tat/n:.2f}")
-print(f"Average Waiting Time: {total_wt/n:.2f}")
-print(f"Average Response Time: {total_rt/n:.2f}")
-
-gantt_chart(timeline.value)
+if __name__ == "__main__":
+    # Paparkan semua input proses sebelum sebarang output simulasi
+    print("=== Input Processes ===")
+    for p in procs:
+        print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}")
+
+    print()
+    q = AdaptiveQuantum(quantum, TARGET_FRACTION) if ADAPTIVE else quantum
+    timeline = env.process(round_robin(env, procs, q, log=ConsoleLog("remaining")))
+    env.run()
+
+    print("\n=== Metrics ===")
+    total_tat = total_wt = total_rt = 0
+    for p in procs:
+        tat = p.completion_time - p.arrival
+        wt = tat - p.burst
+        rt = p.response_time
+        total_tat += tat
+        total_wt += wt
+        total_rt += rt
+        print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}, "
+              f"Start={p.start_time}, Completion={p.completion_time}, "
+              f"TAT={tat}, WT={wt}, RT={rt}")
+
+    n = len(procs)
+    print(f"\nAverage Turnaround Time: {total_tat/n:.2f}")
+    print(f"Average Waiting Time: {total_wt/n:.2f}")
+    print(f"Average Response Time: {total_rt/n:.2f}")
+
+    switches, rate, avg_rt = tradeoff(timeline.value, procs)
+    print("\n=== Quantum Trade-off ===")
+    if ADAPTIVE:
+        print("Quantum over time: " + ", ".join(f"t={t}: {v}" for t, v in q.history))
+    else:
+        print(f"Quantum: {quantum}")
+    print(f"Context switches: {switches} ({rate:.3f} per time unit), Average Response Time: {avg_rt:.2f}")
+
+    gantt_chart(timeline.value)
@@ -0,0 +1,276 @@
+# pip install simpy
+# coded by zainuddin@codemaster.my
+# for educational purposes only
+
+import argparse
+import os
+import sys
+
+# Import berat (engine → skrip → simpy, json, csv, multiprocessing) dibuat
+# hanya bila perlu supaya `simulate.py --help` dan mod quiet bermula pantas.
+
+# ======================
+# Command-line Driver
+# ======================
+# Contoh:
+#   python simulate.py rr workload.csv --quantum 4
+#   python simulate.py priority-p workload.json --ctx 1 --aging --format json
+#   python simulate.py batch runs.json --jobs 8 --format csv
+#
+# Workload: CSV (name,arrival,burst[,priority]), JSON / JSONL
+# (objek dengan kunci yang sama) atau trace binari .trace (tracefile.py). Manifest batch: JSON list atau JSONL,
+# setiap baris {"algorithm": ..., "workload": ..., "quantum": ..., "events": ..., ...}.
+
+ALGORITHM_NAMES = ("fcfs", "sjf", "srtf", "rr", "priority-np", "priority-p", "cfs")
+FORMATS = ("text", "json", "csv", "quiet")
+
+# Nama pilihan CLI / kunci manifest → nama parameter fungsi scheduler
+PARAMS = {
+    "quantum": "quantum",
+    "ctx": "ctx_overhead",
+    "aging": "aging",
+    "aging_interval": "aging_interval",
+    "aging_step": "aging_step",
+    "target_latency": "target_latency",
+    "min_granularity": "min_granularity",
+}
+
+DEFAULT_QUANTUM = 3   # RR tanpa --quantum / "quantum" dalam manifest
+
+
+# ======================
+# Workload Loading
+# ======================
+def load_workload(path: str):
+    """Return a list of (name, arrival, burst, priority) tuples."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".trace":
+        import tracefile
+        with tracefile.Trace(path) as trace:
+            return list(trace.rows())
+    with open(path, newline="") as f:
+        if ext == ".csv":
+            import csv
+            rows = list(csv.DictReader(f))
+        elif ext == ".json":
+            import json
+            rows = json.load(f)
+        elif ext == ".jsonl":
+            import json
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            raise ValueError(f"{path}: unsupported workload format (use .csv, .json, .jsonl or .trace)")
+    return [(str(r["name"]), int(r["arrival"]), int(r["burst"]), int(r.get("priority") or 0))
+            for r in rows]
+
+
+def load_manifest(path: str):
+    import json
+    with open(path) as f:
+        if path.lower().endswith(".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+
+# ======================
+# Run
+# ======================
+def run_one(spec: dict, base_dir: str = "."):
+    """
+    Run one simulation described by `spec` (algorithm, workload path, parameters)
+    and return a result dict with the timeline, per-process metrics and averages.
+    """
+    import engine
+    import eventlog
+
+    workload_path = os.path.join(base_dir, spec["workload"])
+    workload = load_workload(workload_path)
+    params = _used_params(spec)
+    if spec["algorithm"] == "rr":
+        params.setdefault("quantum", DEFAULT_QUANTUM)
+    kwargs = dict(params)
+    if spec.get("adaptive_target") and spec["algorithm"] == "rr":
+        # Quantum adaptif: mula dengan --quantum (atau default), sasaran pecahan siap dalam satu slice
+        adaptive = engine.load("rr").AdaptiveQuantum(params["quantum"], spec["adaptive_target"])
+        kwargs["quantum"] = adaptive
+        params["adaptive_target"] = spec["adaptive_target"]
+    events = spec.get("events") and os.path.join(base_dir, spec["events"])
+    with eventlog.open_log(events) as log:
+        timeline, metrics = engine.simulate(spec["algorithm"], workload,
+                                            engine=spec.get("engine", "simpy"), log=log, **kwargs)
+    avg_tat, avg_wt, avg_rt = engine.averages(workload, metrics)
+    tradeoff = None
+    if "quantum" in kwargs and hasattr(kwargs["quantum"], "history"):
+        params["quantum_history"] = kwargs["quantum"].history
+        # Kadar context switch lawan purata RT (avg RT sudah dikira di atas)
+        switches, rate, _ = engine.load("rr").tradeoff(timeline, ())
+        tradeoff = {"switches": switches, "switch_rate": rate}
+    processes = []
+    for (name, arrival, burst, priority), (_, start, completion, response) in zip(workload, metrics):
+        tat = completion - arrival
+        processes.append({"name": name, "arrival": arrival, "burst": burst, "priority": priority,
+                          "start": start, "completion": completion,
+                          "tat": tat, "wt": tat - burst, "rt": response})
+    result = {
+        "algorithm": spec["algorithm"],
+        "workload": spec["workload"],
+        "params": params,
+        "processes": processes,
+        "timeline": timeline,
+        "avg_tat": avg_tat,
+        "avg_wt": avg_wt,
+        "avg_rt": avg_rt,
+    }
+    if tradeoff:
+        result.update(tradeoff)
+    return result
+
+
+def _used_params(spec: dict) -> dict:
+    # Hanya parameter yang diterima algoritma ini; yang lain diabaikan oleh engine.simulate,
+    # jadi jangan laporkan seolah-olah ia berkesan (cth. --quantum untuk sjf)
+    import engine
+    algo = engine.ALGORITHMS.get(spec.get("algorithm"))
+    accepted = algo.params if algo else ()
+    return {PARAMS[k]: v for k, v in spec.items() if k in PARAMS and v is not None and PARAMS[k] in accepted}
+
+
+def _run_task(task):
+    # Satu spec yang gagal tidak menggugurkan run lain dalam batch
+    spec, base_dir = task
+    try:
+        return run_one(spec, base_dir)
+    except Exception as exc:
+        return {
+            "algorithm": spec.get("algorithm"),
+            "workload": spec.get("workload"),
+            "params": _used_params(spec),
+            "error": f"{type(exc).__name__}: {exc}",
+            "processes": [],
+            "timeline": [],
+        }
+
+
+def run_batch(specs, base_dir: str = ".", jobs: int = 1):
+    """
+    Run every spec in one process (jobs=1) or across a pool of `jobs` workers, keeping order.
+    A run that raises gets a result with an "error" message instead of metrics.
+    """
+    tasks = [(spec, base_dir) for spec in specs]
+    if jobs > 1 and len(tasks) > 1:
+        from multiprocessing import Pool
+        with Pool(min(jobs, len(tasks))) as pool:
+            return pool.map(_run_task, tasks, chunksize=max(1, len(tasks) // (jobs * 4)))
+    return [_run_task(t) for t in tasks]
+
+
+# ======================
+# Output
+# ======================
+def write_text(results, out):
+    for res in results:
+        params = ", ".join(f"{k}={v}" for k, v in res["params"].items())
+        out.write(f"=== {res['algorithm']} | {res['workload']}" + (f" | {params}" if params else "") + " ===\n")
+        if "error" in res:
+            out.write(f"Error: {res['error']}\n\n")
+            continue
+        for p in res["processes"]:
+            out.write(f"{p['name']} | A={p['arrival']}, B={p['burst']}, P={p['priority']}, "
+                      f"Start={p['start']}, Complete={p['completion']}, "
+                      f"TAT={p['tat']}, WT={p['wt']}, RT={p['rt']}\n")
+        out.write(f"\nAverage Turnaround Time: {res['avg_tat']:.2f}\n")
+        out.write(f"Average Waiting Time:    {res['avg_wt']:.2f}\n")
+        out.write(f"Average Response Time:   {res['avg_rt']:.2f}\n")
+        if "switches" in res:
+            out.write(f"Context Switches:        {res['switches']} "
+                      f"({res['switch_rate']:.3f} per unit time, vs avg RT {res['avg_rt']:.2f})\n")
+        out.write("\n=== Gantt Chart ===\n")
+        for (st, en, name) in res["timeline"]:
+            out.write(f"{name}: {st} → {en}\n")
+        out.write("\n")
+
+
+def write_json(results, out):
+    import json
+    json.dump(results, out, indent=2)
+    out.write("\n")
+
+
+def write_csv(results, out):
+    # Satu baris bagi setiap proses dalam setiap run; lajur per-run (avg_rt, switches,
+    # switch_rate) diulang pada setiap baris, kosong jika tiada
+    import csv
+    writer = csv.writer(out)
+    writer.writerow(["run", "algorithm", "workload", "name", "arrival", "burst", "priority",
+                     "start", "completion", "tat", "wt", "rt", "avg_rt", "switches", "switch_rate"])
+    for k, res in enumerate(results):
+        for p in res["processes"]:
+            writer.writerow([k, res["algorithm"], res["workload"], p["name"], p["arrival"],
+                             p["burst"], p["priority"], p["start"], p["completion"],
+                             p["tat"], p["wt"], p["rt"], res.get("avg_rt", ""),
+                             res.get("switches", ""), res.get("switch_rate", "")])
+
+
+WRITERS = {"text": write_text, "json": write_json, "csv": write_csv}
+
+
+# ======================
+# Main
+# ======================
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Run the CPU scheduling simulations without editing the scripts.")
+    parser.add_argument("algorithm", choices=ALGORITHM_NAMES + ("batch",),
+                        help="algorithm to run, or 'batch' to run a manifest of runs")
+    parser.add_argument("path", help="workload file (.csv/.json/.jsonl/.trace), or the manifest for batch")
+    parser.add_argument("--quantum", type=int, help="Round Robin time quantum")
+    parser.add_argument("--adaptive-target", type=float,
+                        help="adapt the RR quantum online so this fraction of jobs finish in one slice")
+    parser.add_argument("--ctx", type=int, help="context switch overhead (srtf, priority-*, cfs)")
+    parser.add_argument("--aging", action="store_true", default=None, help="enable aging (priority-p)")
+    parser.add_argument("--aging-interval", type=int)
+    parser.add_argument("--aging-step", type=int)
+    parser.add_argument("--target-latency", type=int, help="CFS target latency")
+    parser.add_argument("--min-granularity", type=int, help="CFS minimum granularity")
+    parser.add_argument("--engine", choices=("simpy", "step"), default="simpy")
+    parser.add_argument("--format", choices=FORMATS, default="text")
+    parser.add_argument("--events", help="write scheduler events to this file (.jsonl, otherwise binary)")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes for batch mode")
+    parser.add_argument("-o", "--output", help="write results here instead of stdout")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.algorithm == "batch":
+        specs = load_manifest(args.path)
+        base_dir = os.path.dirname(os.path.abspath(args.path))
+        for spec in specs:
+            spec.setdefault("engine", args.engine)
+    else:
+        spec = {"algorithm": args.algorithm, "workload": args.path, "engine": args.engine,
+                "events": args.events}
+        spec.update({k: getattr(args, k) for k in PARAMS})
+        spec["adaptive_target"] = args.adaptive_target
+        specs, base_dir = [spec], "."
+
+    results = run_batch(specs, base_dir, args.jobs)
+    failed = [res for res in results if "error" in res]
+    for res in failed:
+        print(f"{res['algorithm']} | {res['workload']}: {res['error']}", file=sys.stderr)
+    status = 1 if failed else 0
+
+    if args.format == "quiet":
+        return status
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        WRITERS[args.format](results, out)
+    finally:
+        if args.output:
+            out.close()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,17 +2,22 @@
 # coded by zainuddin@codemaster.my
 # for educational purposes only
 
+import heapq
 import simpy
+from eventlog import ConsoleLog, NullLog
+from predictors import ExponentialAverage, oracle_report
 
 # ======================
 # SJF Simulation Setup
 # ======================
 
 class Process:
-    def __init__(self, name, arrival, burst):
+    def __init__(self, name, arrival, burst, category=None):
         self.name = name
         self.arrival = arrival
         self.burst = burst
+        self.category = category  # kelas proses (untuk ramalan burst)
+        self.predicted = None
         self.start_time = None
         self.completion_time = None
         self.response_time = None
@@ -31,15 +36,23 @@ procs = [
     Process("P4", 5, 3)
 ]
 
+# Ramalan burst (exponential averaging) — False = guna burst sebenar
+PREDICT = False
+ALPHA = 0.5           # berat burst terkini
+INITIAL_GUESS = 5     # anggaran awal bagi setiap kelas
+
 
 # ======================
 # SJF Non-Preemptive Function
 # ======================
 
-def sjf_non_preemptive(env, processes):
+def sjf_non_preemptive(env, processes, log=None, predictor=None):
+    # predictor: None = burst sebenar; atau BurstPredictor (lihat predictors.py)
+    log = log or NullLog()
     time_log = []
     processes = sorted(processes, key=lambda p: p.arrival)
-    ready = []
+    ready = []  # heap (burst/ramalan, seq, proses); seq kekalkan susunan tiba bila sama
+    seq = 0
     i = 0
     n = len(processes)
     time = 0
@@ -47,20 +60,22 @@ def sjf_non_preemptive(env, processes):
     while i < n or ready:
         # Tambah proses ke ready queue bila sudah tiba
         while i < n and processes[i].arrival <= time:
-            ready.append(processes[i])
+            p = processes[i]
+            p.predicted = predictor.predict(p) if predictor else p.burst
+            heapq.heappush(ready, (p.predicted, seq, p))
+            seq += 1
             i += 1
 
         if not ready:
             # Tiada proses — CPU idle
             next_arrival = processes[i].arrival
-            print(f"CPU idle from {time} to {next_arrival}")
+            log.emit("idle", time, next_arrival, "IDLE")
             yield env.timeout(next_arrival - time)
             time = next_arrival
             continue
 
-        # Pilih proses dengan burst time paling kecil
-        ready.sort(key=lambda p: p.burst)
-        current = ready.pop(0)
+        # Pilih proses dengan burst time (atau ramalan) paling kecil
+        current = heapq.heappop(ready)[2]
 
         # Kira masa mula & response
         current.start_time = time
@@ -68,12 +83,15 @@ def sjf_non_preemptive(env, processes):
 
         start = time
         end = time + current.burst
-        print(f"{current.name} running from {start} to {end}")
+        log.emit("dispatch", start, end, current.name)
 
         time_log.append((start, end, current.name))
         yield env.timeout(current.burst)
         time = end
         current.completion_time = time
+        log.emit("complete", time, time, current.name)
+        if predictor:
+            predictor.observe(current, current.burst)
 
     return time_log
 
@@ -88,35 +106,41 @@ def gantt_chart(timeline):
 # Run Simulation
 # ======================
 
-# Paparkan semua input proses sebelum sebarang output simulasi
-print("=== Input Processes ===")
-for p in procs:
-    print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}")
-
-print()
-timeline = env.process(sjf_non_preemptive(env, procs))
-env.run()
-
-# ======================
-# Compute Metrics
-# ======================
-
-print("\n=== Metrics ===")
-total_tat = total_wt = total_rt = 0
-for p in procs:
-    tat = p.completion_time - p.arrival
-    wt = tat - p.burst
-    rt = p.response_time
-    total_tat += tat
-    total_wt += wt
-    total_rt += rt
-    print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}, "
-          f"Start={p.start_time}, Completion={p.completion_time}, "
-          f"TAT={tat}, WT={wt}, RT={rt}")
-
-n = len(procs)
-print(f"\nAverage Turnaround Time: {total_tat/n:.2f}")
-print(f"Average Waiting Time: {total_wt/n:.2f}")
-print(f"Average Response Time: {total_rt/n:.2f}")
-
-gantt_chart(timeline.value)
+if __name__ == "__main__":
+    # Paparkan semua input proses sebelum sebarang output simulasi
+    print("=== Input Processes ===")
+    for p in procs:
+        print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}")
+
+    print()
+    predictor = ExponentialAverage(ALPHA, INITIAL_GUESS) if PREDICT else None
+    timeline = env.process(sjf_non_preemptive(env, procs, log=ConsoleLog(), predictor=predictor))
+    env.run()
+
+    # ======================
+    # Compute Metrics
+    # ======================
+
+    print("\n=== Metrics ===")
+    total_tat = total_wt = total_rt = 0
+    for p in procs:
+        tat = p.completion_time - p.arrival
+        wt = tat - p.burst
+        rt = p.response_time
+        total_tat += tat
+        total_wt += wt
+        total_rt += rt
+        print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}, "
+              f"Start={p.start_time}, Completion={p.completion_time}, "
+              f"TAT={tat}, WT={wt}, RT={rt}")
+
+    n = len(procs)
+    print(f"\nAverage Turnaround Time: {total_tat/n:.2f}")
+    print(f"Average Waiting Time: {total_wt/n:.2f}")
+    print(f"Average Response Time: {total_rt/n:.2f}")
+
+    if PREDICT:
+        # Banding dengan SJF yang tahu burst sebenar (oracle)
+        oracle_report(procs, sjf_non_preemptive)
+
+    gantt_chart(timeline.value)
@@ -2,19 +2,25 @@
 # coded by zainuddin@codemaster.my
 # for educational purposes only
 
+import heapq
 import simpy
+from eventlog import NullLog
 from typing import List, Tuple, Optional
+from predictors import BurstPredictor, ExponentialAverage, oracle_report
+from switchcost import resolve
 
 # ======================
 # SRTF Simulation Setup
 # ======================
 
 class Process:
-    def __init__(self, name: str, arrival: int, burst: int):
+    def __init__(self, name: str, arrival: int, burst: int, category: Optional[str] = None):
         self.name = name
         self.arrival = arrival
         self.burst = burst
+        self.category = category  # kelas proses (untuk ramalan burst)
         self.remaining = burst
+        self.predicted: Optional[float] = None
         self.start_time: Optional[int] = None
         self.completion_time: Optional[int] = None
         self.response_time: Optional[int] = None
@@ -37,55 +43,112 @@ procs: List[Process] = [
 ]
 
 # context switch overhead (unit masa), tetapkan 0 jika tak mahu
+# atau guna model kos:
+#   from switchcost import CacheWarmthCost
+#   CTX = CacheWarmthCost(base=1, decay=10)
 CTX = 0
 
+# Ramalan burst (exponential averaging) — False = guna burst sebenar
+PREDICT = False
+ALPHA = 0.5           # berat burst terkini
+INITIAL_GUESS = 5     # anggaran awal bagi setiap kelas
+
 
 # ======================
 # SRTF Function (Preemptive)
 # ======================
-def srtf(env: simpy.Environment, processes: List[Process], ctx_overhead: int = 0):
+def srtf(env: simpy.Environment, processes: List[Process], ctx_overhead: int = 0,
+         predictor: Optional[BurstPredictor] = None, log: Optional[NullLog] = None):
     """
     Jalankan SRTF secara 'tick-by-tick' (1 unit masa setiap kitaran).
     Preempt bila terdapat proses dengan remaining lebih kecil daripada proses semasa.
     Tie-break: remaining, arrival, name.
+    Dengan predictor, remaining = ramalan (dibuat sekali semasa tiba) - masa yang sudah dijalankan.
+    ctx_overhead: CTX tetap (int) atau model kos switch (lihat switchcost.py).
+    log: sink eventlog; "dispatch" dihantar bila setiap segmen Gantt ditutup (value = remaining).
     """
+    log = log or NullLog()
     time_log: List[Tuple[int, int, str]] = []   # (start, end, name)
     processes = sorted(processes, key=lambda p: (p.arrival, p.name))
-    ready: List[Process] = []
+    # Heap (estimate, arrival, name, seq, proses): estimate hanya berubah untuk
+    # proses yang sedang berjalan, jadi entri dalam heap kekal sah
+    ready: List[Tuple[float, int, str, int, Process]] = []
+    seq = 0
     i = 0
     n = len(processes)
 
     current: Optional[Process] = None
     slice_start: Optional[int] = None
+    switch = resolve(ctx_overhead)
+    warming = False   # switch berlaku; warmup dicaj pada dispatch seterusnya
+
+    def admit(p: Process):
+        p.predicted = predictor.predict(p) if predictor else p.burst
+        push(p)
+
+    def push(p: Process):
+        nonlocal seq
+        heapq.heappush(ready, (estimate(p), p.arrival, p.name, seq, p))
+        seq += 1
+
+    def estimate(p: Process):
+        if predictor is None:
+            return p.remaining
+        return max(p.predicted - (p.burst - p.remaining), 0)
 
     def pick_shortest() -> Optional[Process]:
         if not ready:
             return None
-        ready.sort(key=lambda p: (p.remaining, p.arrival, p.name))
-        return ready.pop(0)
+        return heapq.heappop(ready)[-1]
 
-    def close_slice(until_time: int, pid: str):
+    def close_slice(until_time: int, p: Process):
         # Tutup segmen Gantt untuk proses semasa
         if slice_start is not None and until_time > slice_start:
-            time_log.append((slice_start, until_time, pid))
+            time_log.append((slice_start, until_time, p.name))
+            log.emit("dispatch", slice_start, until_time, p.name, p.remaining)
+
+    def charge(cost: int, extend: bool = False):
+        # Slice CTX; warmup menyambung slice CTX switch yang baru tamat
+        if cost > 0:
+            if extend and time_log and time_log[-1][2] == "CTX" and time_log[-1][1] == env.now:
+                time_log[-1] = (time_log[-1][0], env.now + cost, "CTX")
+            else:
+                time_log.append((env.now, env.now + cost, "CTX"))
+            log.emit("ctx", env.now, env.now + cost, "CTX")
+            yield env.timeout(cost)
+
+    def context_switch(outgoing: Process, ran_since: Optional[int]):
+        # outgoing berhenti; kos warmup menunggu proses yang benar-benar di-dispatch
+        nonlocal warming
+        if switch is None:
+            return
+        if ran_since is not None and env.now > ran_since:
+            switch.ran(outgoing, env.now)
+        warming = True
+        yield from charge(switch.cost(env.now))
+
+    def dispatch(p: Process):
+        nonlocal warming
+        if warming:
+            warming = False
+            yield from charge(switch.warmup(p, env.now), extend=True)
 
     while i < n or ready or current:
         # Masukkan proses yang sudah tiba pada env.now
         while i < n and processes[i].arrival <= env.now:
             p = processes[i]
-            ready.append(p)
+            admit(p)
             i += 1
 
             # Preempt check (jika ada current dan pendatang baru lebih pendek)
-            if current and p.remaining < current.remaining:
+            if current and estimate(p) < estimate(current):
                 # Tutup segmen semasa
-                close_slice(env.now, current.name)
+                close_slice(env.now, current)
+                log.emit("preempt", env.now, env.now, current.name, current.remaining)
                 # Context switch (jika ada)
-                if ctx_overhead > 0:
-                    time_log.append((env.now, env.now + ctx_overhead, "CTX"))
-                    yield env.timeout(ctx_overhead)
+                yield from context_switch(current, slice_start)
                 # Letak balik current dalam ready
-                ready.append(current)
+                push(current)
                 current = None
                 slice_start = None
 
@@ -95,6 +158,7 @@ def srtf(env: simpy.Environment, processes: List[Process], ctx_overhead: int = 0
             # Jadikan segmen IDLE (pilihan: paparkan atau tidak)
             if env.now < next_arrival:
                 time_log.append((env.now, next_arrival, "IDLE"))
+                log.emit("idle", env.now, next_arrival, "IDLE")
                 yield env.timeout(next_arrival - env.now)
             continue
 
@@ -104,6 +168,7 @@ def srtf(env: simpy.Environment, processes: List[Process], ctx_overhead: int = 0
             if current is None and i >= n:
                 break  # tiada lagi proses
             if current:
+                yield from dispatch(current)
                 if current.start_time is None:
                     current.start_time = env.now
                     current.response_time = current.start_time - current.arrival
@@ -116,32 +181,34 @@ def srtf(env: simpy.Environment, processes: List[Process], ctx_overhead: int = 0
 
             # Jika siap, tutup segmen dan rekod completion
             if current.remaining == 0:
-                close_slice(env.now, current.name)
+                close_slice(env.now, current)
                 current.completion_time = env.now
-                current = None
-                slice_start = None
+                log.emit("complete", env.now, env.now, current.name)
+                if predictor:
+                    predictor.observe(current, current.burst)
+                done, current = current, None
+                done_since, slice_start = slice_start, None
                 # Optional: context switch sebelum proses seterusnya
-                if ctx_overhead > 0 and (ready or i < n):
-                    time_log.append((env.now, env.now + ctx_overhead, "CTX"))
-                    yield env.timeout(ctx_overhead)
+                if ready or i < n:
+                    yield from context_switch(done, done_since)
             else:
                 # Sebelum next tick, masukkan proses yang tiba tepat pada masa ini (untuk peluang preempt)
                 while i < n and processes[i].arrival <= env.now:
-                    ready.append(processes[i])
+                    admit(processes[i])
                     i += 1
                     # Preempt jika perlu (ikut remaining)
                     if current and ready:
-                        ready.sort(key=lambda p: (p.remaining, p.arrival, p.name))
-                        candidate = ready[0]
-                        if candidate.remaining < current.remaining:
+                        candidate = ready[0][-1]
+                        if estimate(candidate) < estimate(current):
                             # tutup segmen semasa
-                            close_slice(env.now, current.name)
-                            if ctx_overhead > 0:
-                                time_log.append((env.now, env.now + ctx_overhead, "CTX"))
-                                yield env.timeout(ctx_overhead)
+                            close_slice(env.now, current)
+                            log.emit("preempt", env.now, env.now, current.name, current.remaining)
+                            yield from context_switch(current, slice_start)
                             # gantikan current
-                            ready.append(current)
-                            current = ready.pop(0)
+                            candidate = heapq.heappop(ready)[-1]
+                            push(current)
+                            current = candidate
+                            yield from dispatch(current)
                             if current.start_time is None:
                                 current.start_time = env.now
                                 current.response_time = current.start_time - current.arrival
@@ -160,34 +227,40 @@ def gantt_chart(timeline: List[Tuple[int, int, str]]):
 # Run Simulation
 # ======================
 
-# Paparkan semua input proses sebelum sebarang output simulasi
-print("=== Input Processes ===")
-for p in procs:
-    print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}")
+if __name__ == "__main__":
+    # Paparkan semua input proses sebelum sebarang output simulasi
+    print("=== Input Processes ===")
+    for p in procs:
+        print(f"{p.name} | Arrival={p.arrival}, Burst={p.burst}")
 
-print()
-timeline = env.process(srtf(env, procs, ctx_overhead=CTX))
-env.run()
+    print()
+    predictor = ExponentialAverage(ALPHA, INITIAL_GUESS) if PREDICT else None
+    timeline = env.process(srtf(env, procs, ctx_overhead=CTX, predictor=predictor))
+    env.run()
 
-# ======================
-# Compute Metrics
-# ======================
-print("\n=== Metrics ===")
-tot_tat = tot_wt = tot_rt = 0.0
-for p in procs:
-    tat = p.completion_time - p.arrival
-    wt = tat - p.burst
-    rt = p.response_time
-    tot_tat += tat
-    tot_wt += wt
-    tot_rt += rt
-    print(f"{p.name} | A={p.arrival}, B={p.burst}, "
-          f"Start={p.start_time}, Complete={p.completion_time}, "
-          f"TAT={tat}, WT={wt}, RT={rt}")
-
-n = len(procs)
-print(f"\nAverage Turnaround Time: {tot_tat/n:.2f}")
-print(f"Average Waiting Time:    {tot_wt/n:.2f}")
-print(f"Average Response Time:   {tot_rt/n:.2f}")
-
-gantt_chart(timeline.value)
+    # ======================
+    # Compute Metrics
+    # ======================
+    print("\n=== Metrics ===")
+    tot_tat = tot_wt = tot_rt = 0.0
+    for p in procs:
+        tat = p.completion_time - p.arrival
+        wt = tat - p.burst
+        rt = p.response_time
+        tot_tat += tat
+        tot_wt += wt
+        tot_rt += rt
+        print(f"{p.name} | A={p.arrival}, B={p.burst}, "
+              f"Start={p.start_time}, Complete={p.completion_time}, "
+              f"TAT={tat}, WT={wt}, RT={rt}")
+
+    n = len(procs)
+    print(f"\nAverage Turnaround Time: {tot_tat/n:.2f}")
+    print(f"Average Waiting Time:    {tot_wt/n:.2f}")
+    print(f"Average Response Time:   {tot_rt/n:.2f}")
+
+    if PREDICT:
+        # Banding dengan SRTF yang tahu burst sebenar (oracle)
+        oracle_report(procs, srtf, ctx_overhead=CTX)
+
+    gantt_chart(timeline.value)
@@ -0,0 +1,83 @@
+# coded by zainuddin@codemaster.my
+# for educational purposes only
+
+import math
+from typing import Callable, Optional
+
+# ======================
+# Context-Switch Cost Models
+# ======================
+# Skrip srtf.py, priority-non-preemtive.py dan priority-preemtive.py
+# terima sama ada nombor CTX tetap atau model di sini sebagai ctx_overhead.
+# Scheduler panggil:
+#   cost(now)         → slice CTX semasa switch (simpan/muat konteks)
+#   warmup(p, now)    → tambahan bila p benar-benar di-dispatch selepas switch
+#                       (cache reload, migrasi); slice CTX dipanjangkan
+#   ran(p, now)       → bila p berhenti berjalan selepas jalan > 0 unit masa
+# Kos warmup dikira untuk proses yang sebenarnya dijalankan, bukan tekaan
+# semasa switch bermula. Semua O(1).
+
+
+class FlatCost:
+    """Kos tetap bagi setiap switch — sama seperti CTX integer."""
+
+    def __init__(self, ctx: int = 1):
+        self.ctx = ctx
+
+    def cost(self, now) -> int:
+        return self.ctx
+
+    def warmup(self, incoming, now) -> int:
+        return 0
+
+    def ran(self, p, now) -> None:
+        pass
+
+
+class CacheWarmthCost:
+    """
+    cost   = base (setiap switch)
+    warmup = reload + migration (jika core berubah), untuk proses yang di-dispatch
+    reload = ceil(working_set * reload_per_unit * (1 - exp(-gap / decay)))
+
+    gap   : masa sejak proses kali terakhir berjalan; proses yang belum
+            pernah jalan dianggap cache sejuk sepenuhnya.
+    working_set : p.working_set jika ada, jika tidak default_working_set.
+    core_of(p, now) : core tempat proses akan dijalankan (default: satu core, 0),
+            berbanding p.last_core untuk mengesan migrasi.
+    """
+
+    def __init__(self, base: int = 1, reload_per_unit: float = 0.5, decay: float = 10.0,
+                 migration: int = 2, default_working_set: int = 4,
+                 core_of: Optional[Callable] = None):
+        self.base = base
+        self.reload_per_unit = reload_per_unit
+        self.decay = decay
+        self.migration = migration
+        self.default_working_set = default_working_set
+        self.core_of = core_of or (lambda p, now: 0)
+
+    def cost(self, now) -> int:
+        return self.base
+
+    def warmup(self, incoming, now) -> int:
+        last_ran = getattr(incoming, "last_ran", None)
+        coldness = 1.0 if last_ran is None else 1.0 - math.exp(-(now - last_ran) / self.decay)
+        working_set = getattr(incoming, "working_set", None) or self.default_working_set
+        reload = math.ceil(working_set * self.reload_per_unit * coldness)
+
+        last_core = getattr(incoming, "last_core", None)
+        core = self.core_of(incoming, now)
+        incoming.last_core = core
+        migrated = last_core is not None and last_core != core
+        return reload + (self.migration if migrated else 0)
+
+    def ran(self, p, now) -> None:
+        p.last_ran = now
+
+
+def resolve(ctx_overhead):
+    """Tukar ctx_overhead (int atau model) kepada model; 0 → None (tiada CTX langsung)."""
+    if hasattr(ctx_overhead, "cost"):
+        return ctx_overhead
+    return FlatCost(ctx_overhead) if ctx_overhead > 0 else None
@@ -0,0 +1,235 @@
+# coded by zainuddin@codemaster.my
+# for educational purposes only
+
+import argparse
+import array
+import csv
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# ======================
+# Binary Trace Format
+# ======================
+# Fail lebar-tetap, disusun ikut lajur, little-endian:
+#
+#   header (64 bait): MAGIC, version (u32), reserved (u32), count (u64),
+#                     names_offset (u64), names_count (u64), padding
+#   arrival  int64[count]
+#   burst    int64[count]
+#   priority int64[count]
+#   name_id  uint32[count]
+#   names    (pada names_offset) bagi setiap nama: panjang (u16) + utf-8
+#
+# Dibaca melalui mmap: lajur ialah view terus ke atas fail (numpy.memmap
+# jika NumPy ada, jika tidak memoryview), jadi membuka trace 100M proses
+# tidak menyalin apa-apa. Worker dalam run selari buka semula path yang
+# sama dan berkongsi page cache OS.
+
+MAGIC = b"CPUTRC01"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQQ")
+HEADER_SIZE = 64
+CHUNK = 1 << 20   # baris setiap chunk semasa menulis
+
+Row = Tuple[str, int, int, int]   # (name, arrival, burst, priority)
+
+
+def _layout(count: int) -> Dict[str, int]:
+    offsets = {"arrival": HEADER_SIZE}
+    offsets["burst"] = offsets["arrival"] + 8 * count
+    offsets["priority"] = offsets["burst"] + 8 * count
+    offsets["name_id"] = offsets["priority"] + 8 * count
+    offsets["names"] = (offsets["name_id"] + 4 * count + 7) // 8 * 8
+    return offsets
+
+
+# ======================
+# Write
+# ======================
+def write_trace(path: str, rows: Iterable[Row]) -> int:
+    """
+    Tulis trace daripada aliran baris (name, arrival, burst, priority).
+    Bilangan baris tidak perlu diketahui awal: setiap lajur ditulis ke fail
+    sementara secara chunk, kemudian dicantum. Pulangkan bilangan baris.
+    """
+    name_ids: Dict[str, int] = {}
+    typecodes = {"arrival": "q", "burst": "q", "priority": "q", "name_id": "I"}
+    tmpdir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        parts = {col: open(os.path.join(tmpdir, col), "wb") for col in typecodes}
+        chunk = {col: array.array(code) for col, code in typecodes.items()}
+        count = 0
+
+        def flush():
+            for col, arr in chunk.items():
+                if sys.byteorder != "little":
+                    arr.byteswap()
+                arr.tofile(parts[col])
+                chunk[col] = array.array(typecodes[col])
+
+        for (name, arrival, burst, priority) in rows:
+            chunk["arrival"].append(arrival)
+            chunk["burst"].append(burst)
+            chunk["priority"].append(priority)
+            chunk["name_id"].append(name_ids.setdefault(name, len(name_ids)))
+            count += 1
+            if len(chunk["arrival"]) >= CHUNK:
+                flush()
+        flush()
+        for f in parts.values():
+            f.close()
+
+        offsets = _layout(count)
+        with open(path, "wb") as out:
+            out.write(HEADER.pack(MAGIC, VERSION, 0, count, offsets["names"], len(name_ids)).ljust(HEADER_SIZE, b"\0"))
+            for col in typecodes:
+                with open(os.path.join(tmpdir, col), "rb") as f:
+                    shutil.copyfileobj(f, out, 1 << 24)
+            out.write(b"\0" * (offsets["names"] - out.tell()))
+            table = []
+            for name in name_ids:   # dict kekalkan susunan id
+                raw = name.encode("utf-8")
+                table.append(struct.pack("<H", len(raw)))
+                table.append(raw)
+            out.write(b"".join(table))
+        return count
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def _csv_rows(path: str) -> Iterator[Row]:
+    with open(path, newline="") as f:
+        for r in csv.DictReader(f):
+            yield str(r["name"]), int(r["arrival"]), int(r["burst"]), int(r.get("priority") or 0)
+
+
+def _jsonl_rows(path: str) -> Iterator[Row]:
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                r = json.loads(line)
+                yield str(r["name"]), int(r["arrival"]), int(r["burst"]), int(r.get("priority") or 0)
+
+
+def convert(src: str, dst: str) -> int:
+    """CSV (name,arrival,burst[,priority]) atau JSONL → trace binari, secara streaming."""
+    ext = os.path.splitext(src)[1].lower()
+    if ext == ".csv":
+        return write_trace(dst, _csv_rows(src))
+    if ext == ".jsonl":
+        return write_trace(dst, _jsonl_rows(src))
+    raise ValueError(f"{src}: unsupported source format (use .csv or .jsonl)")
+
+
+# ======================
+# Read (zero-copy)
+# ======================
+class Trace:
+    """
+    Trace yang dibuka melalui mmap. Lajur: arrival, burst, priority, name_id.
+    Boleh di-pickle (hanya path dihantar), jadi worker multiprocessing
+    memetakan fail yang sama tanpa salinan.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, names_offset, names_count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a CPU trace file")
+        if version != VERSION:
+            raise ValueError(f"{path}: unsupported trace version {version}")
+        self.count = count
+        self._names_offset = names_offset
+        self.names_count = names_count
+        self._names: Optional[List[str]] = None
+        self._offsets = _layout(count)
+
+    def __reduce__(self):
+        return (Trace, (self.path,))
+
+    def __len__(self):
+        return self.count
+
+    def column(self, name: str):
+        """
+        Zero-copy view: numpy.memmap jika NumPy ada, jika tidak memoryview.
+        Setiap lajur ada pemetaan sendiri, jadi close() selamat walaupun lajur masih dipegang.
+        """
+        dtype, code = {"name_id": ("<u4", "I")}.get(name, ("<i8", "q"))
+        offset = self._offsets[name]
+        try:
+            import numpy as np
+        except ImportError:
+            size = struct.calcsize(code)
+            with open(self.path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return memoryview(mm)[offset:offset + size * self.count].cast(code)
+        return np.memmap(self.path, dtype=dtype, mode="r", offset=offset, shape=(self.count,))
+
+    def columns(self) -> Dict[str, object]:
+        """arrival, burst, priority — lajur input sahaja (analytics.report perlukan start/completion)."""
+        return {col: self.column(col) for col in ("arrival", "burst", "priority")}
+
+    def names(self) -> List[str]:
+        # Jadual nama dibaca sekali sahaja, bila diperlukan
+        if self._names is None:
+            names, offset, mm = [], self._names_offset, self._mm
+            for _ in range(self.names_count):
+                (size,) = struct.unpack_from("<H", mm, offset)
+                names.append(mm[offset + 2:offset + 2 + size].decode("utf-8"))
+                offset += 2 + size
+            self._names = names
+        return self._names
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Row]:
+        """(name, arrival, burst, priority) bagi baris [start, stop), ditukar secara chunk."""
+        stop = self.count if stop is None else min(stop, self.count)
+        names = self.names()
+        cols = [self.column(c) for c in ("name_id", "arrival", "burst", "priority")]
+        for lo in range(start, stop, CHUNK):
+            hi = min(lo + CHUNK, stop)
+            name_id, arrival, burst, priority = (c[lo:hi].tolist() for c in cols)
+            for k, a, b, p in zip(name_id, arrival, burst, priority):
+                yield names[k], a, b, p
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ======================
+# Command Line
+# ======================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert and inspect binary CPU scheduling traces.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    conv = sub.add_parser("convert", help="convert CSV/JSONL to a binary trace")
+    conv.add_argument("src")
+    conv.add_argument("dst")
+    info = sub.add_parser("info", help="show trace header and the first rows")
+    info.add_argument("path")
+    info.add_argument("--head", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.command == "convert":
+        n = convert(args.src, args.dst)
+        print(f"Wrote {n} processes to {args.dst}")
+    else:
+        with Trace(args.path) as trace:
+            print(f"=== {args.path} ===")
+            print(f"Processes: {trace.count}, distinct names: {trace.names_count}")
+            for (name, arrival, burst, priority) in trace.rows(0, args.head):
+                print(f"{name} | Arrival={arrival}, Burst={burst}, Priority={priority}")